@@ -0,0 +1,91 @@
+import base64
+import hashlib
+import io
+import mimetypes
+import os
+import threading
+import uuid
+from collections import namedtuple
+
+# ============================
+# 이미지 에셋 (배경/인트로) — 프로세스당 한 번만 변환/인코딩
+# ============================
+# 원본(binary.PNG, intro_image.png)을 max_width로 줄인 WebP 변형을 static/에 만들고,
+# .streamlit/config.toml 의 server.enableStaticServing = true 이면 /app/static/... URL로 내보낸다.
+# 정적 서빙이 꺼져 있으면 같은 변형의 data URI를 쓴다 (이 경우에도 인코딩은 한 번뿐).
+# 원본 파일의 (mtime, size)가 바뀌면 새 이름으로 다시 만든다.
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+STATIC_URL = "/app/static"
+
+BACKGROUND_MAX_WIDTH = 1920
+INTRO_MAX_WIDTH = 1600
+
+Asset = namedtuple("Asset", "path url mime data_uri")
+
+_lock = threading.Lock()
+_memo = {}
+
+
+def file_signature(path: str):
+    try:
+        st_ = os.stat(path)
+    except OSError:
+        return None
+    return (st_.st_mtime_ns, st_.st_size)
+
+
+def _encode(path: str, max_width, fmt: str):
+    """(bytes, 확장자) — Pillow가 없거나 변환에 실패하면 원본 그대로"""
+    try:
+        from PIL import Image
+
+        with Image.open(path) as im:
+            if max_width and im.width > max_width:
+                im = im.resize((max_width, round(im.height * max_width / im.width)), Image.LANCZOS)
+            if fmt == "jpeg" and im.mode not in ("RGB", "L"):
+                im = im.convert("RGB")
+            buf = io.BytesIO()
+            im.save(buf, format=fmt.upper(), quality=85)
+            return buf.getvalue(), "jpg" if fmt == "jpeg" else fmt
+    except (ImportError, OSError, ValueError):
+        with open(path, "rb") as f:
+            return f.read(), os.path.splitext(path)[1].lstrip(".").lower()
+
+
+def image_asset(path: str, max_width=None, fmt: str = "webp", static_dir: str = STATIC_DIR):
+    """원본 이미지 → Asset(변형 파일 경로, 정적 URL, MIME, data URI). 원본이 없으면 None"""
+    sig = file_signature(path)
+    if sig is None:
+        return None
+    key = (os.path.abspath(path), max_width, fmt, sig)
+    with _lock:
+        if key in _memo:
+            return _memo[key]
+
+    stem = os.path.splitext(os.path.basename(path))[0]
+    digest = hashlib.sha1(repr(key).encode()).hexdigest()[:10]
+    out = os.path.join(static_dir, f"{stem}-{digest}.{'jpg' if fmt == 'jpeg' else fmt}")
+    if os.path.exists(out):
+        # 이전 프로세스가 만든 변형이 있으면 다시 변환하지 않음 (콜드 스타트 단축)
+        with open(out, "rb") as f:
+            data = f.read()
+    else:
+        data, ext = _encode(path, max_width, fmt)
+        out = os.path.join(static_dir, f"{stem}-{digest}.{ext}")
+    name = os.path.basename(out)
+    if not os.path.exists(out):
+        os.makedirs(static_dir, exist_ok=True)
+        tmp = f"{out}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, out)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    mime = mimetypes.guess_type(name)[0] or "application/octet-stream"
+    asset = Asset(out, f"{STATIC_URL}/{name}", mime, f"data:{mime};base64,{base64.b64encode(data).decode()}")
+    with _lock:
+        _memo[key] = asset
+    return asset
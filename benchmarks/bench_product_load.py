@@ -0,0 +1,51 @@
+"""
+제품 데이터 콜드 로딩 벤치마크: CSV 파싱+가공 vs data/.cache 바이너리 캐시
+
+실행:  python benchmarks/bench_product_load.py [--repeat 10]
+(임시 디렉터리에 캐시를 만들기 때문에 실제 data/.cache 는 건드리지 않음)
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import product_cache  # noqa: E402
+
+
+def best_ms(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--repeat", type=int, default=10)
+    args = ap.parse_args()
+
+    csv_path = os.path.join(ROOT, product_cache.PRODUCT_CSV)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        parse_ms = best_ms(
+            lambda: product_cache.prepare_product_df(pd.read_csv(csv_path, encoding="utf-8")),
+            args.repeat,
+        )
+        product_cache.read_product_frame(csv_path, cache_dir)  # 캐시 생성
+        cached_ms = best_ms(lambda: product_cache.read_product_frame(csv_path, cache_dir), args.repeat)
+
+    print(f"format      : {product_cache.CACHE_FORMAT}")
+    print(f"csv + 가공  : {parse_ms:8.2f} ms")
+    print(f"캐시 읽기   : {cached_ms:8.2f} ms")
+    print(f"speedup     : {parse_ms / cached_ms:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+제품 검색 벤치마크: 카탈로그 크기별 str.contains 전체 스캔 vs ProductSearchIndex
+
+실행:  python benchmarks/bench_product_search.py [--sizes 122,1000,10000,50000]
+"""
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from product_search import ProductSearchIndex  # noqa: E402
+
+QUERIES = ["GIS7030", "gis70", "물엿", "포도당", "ㅁㅇ", "없는제품"]
+
+
+def make_catalogue(base: pd.DataFrame, size: int) -> pd.DataFrame:
+    """실제 product_data.csv 행을 복제해 size개까지 늘림 (코드에 일련번호 접미어)"""
+    reps = -(-size // len(base))
+    df = pd.concat([base] * reps, ignore_index=True).iloc[:size].copy()
+    suffix = (df.index // len(base)).astype(str)
+    df["제품코드"] = df["제품코드"].astype(str) + suffix.where(suffix != "0", "")
+    return df
+
+
+def scan(df, queries):
+    results = pd.DataFrame()
+    for q in queries:
+        partial = df[
+            df["제품코드"].astype(str).str.contains(q, case=False, na=False) |
+            df["제품명"].astype(str).str.contains(q, case=False, na=False)
+        ]
+        results = pd.concat([results, partial])
+    return results
+
+
+def timeit(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", default="122,1000,10000,50000")
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args()
+
+    base = pd.read_csv(os.path.join(ROOT, "product_data.csv"), encoding="utf-8")
+    print(f"{'rows':>8} {'build(ms)':>10} {'scan/q(ms)':>11} {'index/q(ms)':>12} {'speedup':>8}")
+    for size in [int(s) for s in args.sizes.split(",")]:
+        df = make_catalogue(base, size)
+        t0 = time.perf_counter()
+        index = ProductSearchIndex.from_frame(df)
+        build_ms = (time.perf_counter() - t0) * 1000
+
+        scan_ms = sum(timeit(lambda q=q: scan(df, [q]), args.repeat) for q in QUERIES) / len(QUERIES)
+        index_ms = sum(timeit(lambda q=q: index.search(q), args.repeat) for q in QUERIES) / len(QUERIES)
+        print(f"{size:>8} {build_ms:>10.1f} {scan_ms:>11.3f} {index_ms:>12.4f} {scan_ms / index_ms:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+앱 시작/rerun 단계별 시간 벤치마크 (perf_timing.RunTimer 기록을 페이지별로 모아 표로 출력)
+
+실행:  python benchmarks/bench_startup.py [--pages Home,제품백서] [--reruns 3]
+페이지마다 새 프로세스에서 AppTest로 앱을 실행해 cold(첫 실행: 모듈 import, 캐시 생성 포함)와
+warm(같은 세션 rerun) 시간을 잰다. 로그인/인트로는 세션 상태로 건너뛴다.
+배포/재시작 후 실제 서버에서는 INCHON1_TIMING=1 로 띄우면 같은 형식의 로그가 stderr에 남는다.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+APP = os.path.join(ROOT, "app_report_incheon1_csv_with_table.py")
+
+
+def run_child(page: str, reruns: int):
+    """한 프로세스 안에서 cold 1회 + warm reruns회 → JSON 한 줄"""
+    t0 = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+
+    import perf_timing
+
+    import_ms = (time.perf_counter() - t0) * 1000
+    at = AppTest.from_file(APP, default_timeout=120)
+    at.session_state["authenticated"] = True
+    at.session_state["intro_done"] = True
+    at.session_state["page"] = page
+    reports = []
+    for _ in range(1 + reruns):
+        at.run()
+        if at.exception:
+            raise SystemExit(f"{page}: {at.exception[0].value}")
+        reports.append(perf_timing.LAST_REPORT)
+    print(json.dumps({"page": page, "streamlit_import_ms": import_ms, "reports": reports}, ensure_ascii=False))
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pages", default="")
+    ap.add_argument("--reruns", type=int, default=3)
+    ap.add_argument("--child", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        run_child(args.child, args.reruns)
+        return
+
+    from views import PAGES
+
+    pages = [p for p in args.pages.split(",") if p] or list(PAGES)
+    for page in pages:
+        out = subprocess.run(
+            [sys.executable, __file__, "--child", page, "--reruns", str(args.reruns)],
+            cwd=ROOT, capture_output=True, text=True, encoding="utf-8",
+        )
+        if out.returncode != 0:
+            print(f"{page}: 실패\n{out.stderr.strip().splitlines()[-1] if out.stderr.strip() else ''}")
+            continue
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        cold, warm = result["reports"][0], result["reports"][1:]
+        print(f"== {page}  (streamlit import {result['streamlit_import_ms']:.0f} ms)")
+        print(f"  cold  total {cold['total_ms']:8.1f} ms  | "
+              + "  ".join(f"{k} {v:.1f}" for k, v in cold["phases"].items()))
+        if warm:
+            best = min(warm, key=lambda r: r["total_ms"])
+            print(f"  warm  total {best['total_ms']:8.1f} ms  | "
+                  + "  ".join(f"{k} {v:.1f}" for k, v in best["phases"].items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+import os
+import secrets
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+import pandas as pd
+
+# ============================
+# 서류 요청 저장소 (SQLite WAL)
+# ============================
+# requests       : 요청별 현재 상태 (request_id 기본키 → 상태 변경은 한 행 UPDATE)
+# request_events : 생성/상태변경 이력 (append-only)
+# 여러 Streamlit 세션이 동시에 써도 SQLite 잠금 + WAL로 직렬화된다.
+DB_PATH = os.path.join("data", "doc_requests.db")
+LEGACY_CSV_PATH = os.path.join("data", "doc_requests.csv")
+
+REQUEST_FIELDS = [
+    "timestamp", "requester", "team", "due", "category",
+    "priority", "ref_product", "details", "files", "status",
+]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS requests (
+    request_id  TEXT PRIMARY KEY,
+    timestamp   TEXT,
+    requester   TEXT,
+    team        TEXT,
+    due         TEXT,
+    category    TEXT,
+    priority    TEXT,
+    ref_product TEXT,
+    details     TEXT,
+    files       TEXT,
+    status      TEXT NOT NULL DEFAULT '대기',
+    updated_at  TEXT
+);
+CREATE TABLE IF NOT EXISTS request_events (
+    seq         INTEGER PRIMARY KEY AUTOINCREMENT,
+    request_id  TEXT NOT NULL,
+    at          TEXT NOT NULL,
+    event       TEXT NOT NULL,
+    status      TEXT
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_initialized = set()
+_index_lock = threading.Lock()
+_index_memo = {}
+
+
+def _now() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def new_request_id(now=None) -> str:
+    """예: REQ-20250102-093015-a1b2c3d4 (생성 시각 + 난수 — 행 위치와 무관한 영구 ID)"""
+    now = now or datetime.now()
+    return f"REQ-{now.strftime('%Y%m%d-%H%M%S')}-{secrets.token_hex(4)}"
+
+
+@contextmanager
+def _connect(db_path: str = DB_PATH):
+    conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+    try:
+        conn.execute("PRAGMA busy_timeout = 30000")
+        if db_path not in _initialized:
+            _init_db(conn)
+            _initialized.add(db_path)
+        yield conn
+    finally:
+        conn.close()
+
+
+def _init_db(conn):
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.executescript(_SCHEMA)
+    conn.execute("CREATE INDEX IF NOT EXISTS ix_requests_requester ON requests(requester)")
+    conn.execute("CREATE INDEX IF NOT EXISTS ix_requests_status ON requests(status)")
+    _migrate_legacy_csv(conn)
+
+
+def _migrate_legacy_csv(conn, csv_path: str = LEGACY_CSV_PATH):
+    """기존 doc_requests.csv가 있으면 최초 1회만 가져옴 (CSV 파일은 그대로 둠)"""
+    if conn.execute("SELECT 1 FROM meta WHERE key = 'legacy_csv_migrated'").fetchone():
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if conn.execute("SELECT 1 FROM meta WHERE key = 'legacy_csv_migrated'").fetchone():
+            conn.execute("COMMIT")
+            return
+        if os.path.exists(csv_path) and os.path.getsize(csv_path) > 0:
+            legacy = pd.read_csv(csv_path, encoding="utf-8-sig", on_bad_lines="skip", dtype=str)
+            for i, rec in enumerate(legacy.to_dict("records")):
+                rec = {k: ("" if pd.isna(v) else v) for k, v in rec.items()}
+                ts = pd.to_datetime(rec.get("timestamp"), errors="coerce")
+                stamp = ts.strftime("%Y%m%d-%H%M%S") if not pd.isna(ts) else "00000000-000000"
+                rid = f"REQ-{stamp}-m{i:04d}"
+                _insert(conn, rid, rec, event="migrated", or_ignore=True)
+        conn.execute("INSERT INTO meta(key, value) VALUES ('legacy_csv_migrated', ?)", (_now(),))
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def _insert(conn, request_id: str, rec: dict, event: str, or_ignore: bool = False):
+    values = [str(rec.get(f, "") or "") for f in REQUEST_FIELDS]
+    if not values[-1]:
+        values[-1] = "대기"
+    conn.execute(
+        f"INSERT {'OR IGNORE ' if or_ignore else ''}INTO requests (request_id, {', '.join(REQUEST_FIELDS)}, updated_at) "
+        f"VALUES (?, {', '.join('?' * len(REQUEST_FIELDS))}, ?)",
+        [request_id, *values, _now()],
+    )
+    conn.execute(
+        "INSERT INTO request_events (request_id, at, event, status) VALUES (?, ?, ?, ?)",
+        (request_id, _now(), event, values[-1]),
+    )
+    _bump_version(conn)
+
+
+def _bump_version(conn):
+    """쓰기마다 1 증가 — 읽는 쪽은 이 숫자만 보고 인덱스 재생성 여부를 판단"""
+    conn.execute(
+        "INSERT INTO meta(key, value) VALUES ('version', 1) "
+        "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"
+    )
+
+
+def add_request(rec: dict, db_path: str = DB_PATH) -> str:
+    """요청 1건 저장 후 발급된 request_id 반환"""
+    with _connect(db_path) as conn:
+        for attempt in range(5):
+            request_id = rec.get("request_id") or new_request_id()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                _insert(conn, request_id, rec, event="created")
+                conn.execute("COMMIT")
+                return request_id
+            except sqlite3.IntegrityError:
+                # 같은 초에 난수까지 겹친 경우 — 새 ID로 재시도 (지정 ID면 그대로 오류)
+                conn.execute("ROLLBACK")
+                if rec.get("request_id") or attempt == 4:
+                    raise
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+
+def update_status(request_id: str, status: str, db_path: str = DB_PATH) -> bool:
+    """기본키로 한 행만 갱신 (+ 이력 1행 추가). 없는 ID면 False"""
+    with _connect(db_path) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            cur = conn.execute(
+                "UPDATE requests SET status = ?, updated_at = ? WHERE request_id = ?",
+                (status, _now(), request_id),
+            )
+            if cur.rowcount:
+                conn.execute(
+                    "INSERT INTO request_events (request_id, at, event, status) VALUES (?, ?, 'status', ?)",
+                    (request_id, _now(), status),
+                )
+                _bump_version(conn)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    return bool(cur.rowcount)
+
+
+def load_requests_df(db_path: str = DB_PATH) -> pd.DataFrame:
+    """현재 상태 전체 (입력 순서) — 기존 CSV 컬럼 + request_id"""
+    with _connect(db_path) as conn:
+        return pd.read_sql_query(
+            f"SELECT request_id, {', '.join(REQUEST_FIELDS)} FROM requests ORDER BY timestamp, rowid",
+            conn,
+        )
+
+
+def request_history(request_id: str, db_path: str = DB_PATH) -> pd.DataFrame:
+    with _connect(db_path) as conn:
+        return pd.read_sql_query(
+            "SELECT at, event, status FROM request_events WHERE request_id = ? ORDER BY seq",
+            conn, params=(request_id,),
+        )
+
+
+def store_version(db_path: str = DB_PATH) -> int:
+    with _connect(db_path) as conn:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+    return int(row[0]) if row else 0
+
+
+class RequestIndex:
+    """
+    현재 상태 프레임 + request_id / requester / status 별 행 위치 사전.
+    화면에서는 전체 표를 매번 필터링하지 않고 사전 조회로 바로 행을 꺼낸다.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df.reset_index(drop=True)
+        self.by_id = {rid: i for i, rid in enumerate(self.df["request_id"])}
+        self.by_requester = self.df.groupby(self.df["requester"].astype(str), sort=False).indices
+        self.by_status = self.df.groupby(self.df["status"].astype(str), sort=False).indices
+
+    def __len__(self):
+        return len(self.df)
+
+    def get(self, request_id):
+        """request_id → 행(dict), 없으면 None"""
+        pos = self.by_id.get(request_id)
+        return None if pos is None else self.df.iloc[pos].to_dict()
+
+    def for_requester(self, requester) -> pd.DataFrame:
+        return self.df.iloc[self.by_requester.get(str(requester), [])]
+
+    def with_status(self, *statuses) -> pd.DataFrame:
+        positions = sorted(p for s in statuses for p in self.by_status.get(s, []))
+        return self.df.iloc[positions]
+
+
+def get_request_index(db_path: str = DB_PATH) -> RequestIndex:
+    """저장소 version이 바뀐 경우에만 다시 읽어 인덱스를 만든다 (프로세스 공용)"""
+    version = store_version(db_path)
+    with _index_lock:
+        memo = _index_memo.get(db_path)
+        if memo and memo[0] == version:
+            return memo[1]
+    index = RequestIndex(load_requests_df(db_path))
+    with _index_lock:
+        _index_memo[db_path] = (version, index)
+    return index
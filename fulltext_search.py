@@ -0,0 +1,202 @@
+import glob
+import html
+import math
+import os
+import re
+import unicodedata
+import uuid
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from product_cache import CACHE_DIR
+
+# ============================
+# 제품백서 본문 전문 검색 (문자 2-gram 역색인 + BM25)
+# ============================
+# 제품특징/제조방법/용도/주요거래처/원재료/원산지 텍스트를 문자 2-gram으로 색인한다.
+# 한국어는 형태소 분석 없이도 2-gram이면 "빙점 조정", "우크라이나" 같은 부분 표현이 잡힌다.
+# 색인은 카탈로그 내용 해시(product_cache.catalogue_version)별로 data/.cache 에 .npz로 저장해
+# 재시작 시 다시 만들지 않는다. 포스팅은 CSR 배열(indptr / doc / tf)이라 질의는 NumPy 누적 연산.
+TEXT_FIELDS = ["제품특징", "제조방법", "용도", "주요거래처", "원재료명 및 함량", "원산지"]
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+MIN_COVERAGE = 0.5       # 질의 2-gram 중 이 비율 이상을 포함한 제품만 결과로
+SNIPPET_CHARS = 60       # 하이라이트 앞뒤로 보여줄 글자 수
+INDEX_VERSION = 1        # 토큰화/저장 형식이 바뀌면 올림
+
+_RUN = re.compile(r"\w+")
+
+
+def _normalize(text) -> str:
+    if text is None or (isinstance(text, float) and pd.isna(text)):
+        return ""
+    return unicodedata.normalize("NFKC", str(text)).lower()
+
+
+def tokenize(text) -> list:
+    """단어(\\w+) 단위로 나눈 뒤 각 단어의 문자 2-gram (한 글자 단어는 그대로)"""
+    tokens = []
+    for run in _RUN.findall(_normalize(text)):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+class FullTextIndex:
+    """
+    제품 프레임 행 순서 기준 BM25 색인.
+    search()는 [(행 위치, 점수)]를 점수 내림차순으로 돌려준다 (df.iloc에 바로 사용).
+    """
+
+    def __init__(self, terms, indptr, docs, tfs, doc_len, codes):
+        self.terms = np.asarray(terms, dtype=str)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.docs = np.asarray(docs, dtype=np.int32)
+        self.tfs = np.asarray(tfs, dtype=np.float32)
+        self.doc_len = np.asarray(doc_len, dtype=np.float32)
+        self.codes = np.asarray(codes, dtype=str)
+        self.size = len(self.doc_len)
+        self.avgdl = float(self.doc_len.mean()) if self.size and self.doc_len.sum() else 1.0
+        self._term_ids = {t: i for i, t in enumerate(self.terms.tolist())}
+        df_counts = np.diff(self.indptr).astype(np.float64)
+        self.idf = np.log1p((self.size - df_counts + 0.5) / (df_counts + 0.5)).astype(np.float32)
+
+    # ---------- 생성 / 저장 ----------
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame):
+        fields = [f for f in TEXT_FIELDS if f in df.columns]
+        postings = {}
+        doc_len = np.zeros(len(df), dtype=np.float32)
+        for pos, values in enumerate(zip(*(df[f].tolist() for f in fields)) if fields else []):
+            counts = Counter()
+            for value in values:
+                counts.update(tokenize(value))
+            doc_len[pos] = sum(counts.values())
+            for term, tf in counts.items():
+                postings.setdefault(term, []).append((pos, tf))
+
+        terms = sorted(postings)
+        indptr = np.zeros(len(terms) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(postings[t]) for t in terms])
+        docs = np.fromiter((p for t in terms for p, _ in postings[t]), dtype=np.int32, count=int(indptr[-1]))
+        tfs = np.fromiter((tf for t in terms for _, tf in postings[t]), dtype=np.float32, count=int(indptr[-1]))
+        codes = df["제품코드"].astype(str).str.strip().tolist() if "제품코드" in df.columns else [""] * len(df)
+        return cls(terms, indptr, docs, tfs, doc_len, codes)
+
+    def save(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = f"{path}.{uuid.uuid4().hex}.tmp.npz"
+        try:
+            np.savez_compressed(tmp, terms=self.terms, indptr=self.indptr, docs=self.docs,
+                                tfs=self.tfs, doc_len=self.doc_len, codes=self.codes)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    @classmethod
+    def load(cls, path: str):
+        with np.load(path, allow_pickle=False) as z:
+            return cls(z["terms"], z["indptr"], z["docs"], z["tfs"], z["doc_len"], z["codes"])
+
+    @classmethod
+    def load_or_build(cls, df: pd.DataFrame, version: str, cache_dir: str = CACHE_DIR):
+        """
+        카탈로그 버전(내용 해시)별 저장본을 읽고, 없거나 행(제품코드 순서)이 맞지 않으면 새로 만들어 저장.
+        이전 버전 저장본은 지운다. 저장 실패는 무시(다음 시작 때 다시 만들 뿐).
+        """
+        path = os.path.join(cache_dir, f"fulltext-v{INDEX_VERSION}-{version[:16]}.npz")
+        codes = df["제품코드"].astype(str).str.strip().tolist() if "제품코드" in df.columns else []
+        if os.path.exists(path):
+            try:
+                index = cls.load(path)
+                if index.codes.tolist() == codes:
+                    return index
+            except (OSError, ValueError, KeyError):
+                pass
+        index = cls.from_frame(df)
+        try:
+            index.save(path)
+            for old in glob.glob(os.path.join(cache_dir, "fulltext-*.npz")):
+                if os.path.abspath(old) != os.path.abspath(path):
+                    os.remove(old)
+        except OSError:
+            pass
+        return index
+
+    # ---------- 검색 ----------
+    def search(self, query: str, limit: int = 20):
+        """BM25 점수 내림차순 [(행 위치, 점수)] — 질의 2-gram 포함 비율이 MIN_COVERAGE 미만인 제품은 제외"""
+        q_terms = Counter(tokenize(query))
+        if not q_terms or not self.size:
+            return []
+        scores = np.zeros(self.size, dtype=np.float32)
+        hits = np.zeros(self.size, dtype=np.int32)
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_len / self.avgdl)
+        for term, q_tf in q_terms.items():
+            tid = self._term_ids.get(term)
+            if tid is None:
+                continue
+            lo, hi = self.indptr[tid], self.indptr[tid + 1]
+            docs, tf = self.docs[lo:hi], self.tfs[lo:hi]
+            scores[docs] += q_tf * self.idf[tid] * tf * (BM25_K1 + 1) / (tf + norm[docs])
+            hits[docs] += 1
+        ok = np.flatnonzero(hits >= math.ceil(MIN_COVERAGE * len(q_terms)))
+        if not len(ok):
+            return []
+        order = ok[np.argsort(-scores[ok], kind="stable")][:limit]
+        return [(int(pos), float(scores[pos])) for pos in order]
+
+
+# ============================
+# 하이라이트 스니펫
+# ============================
+def _highlight_pattern(query: str):
+    """질의 단어(공백 무시 연속 일치)를 우선, 없으면 2-gram 단위로 찾는 정규식"""
+    runs = sorted({r for r in _RUN.findall(_normalize(query))}, key=len, reverse=True)
+    if not runs:
+        return None, None
+    whole = re.compile("|".join(r"\s*".join(map(re.escape, r)) for r in runs), re.IGNORECASE)
+    grams = sorted(set(tokenize(query)), key=len, reverse=True)
+    partial = re.compile("|".join(map(re.escape, grams)), re.IGNORECASE)
+    return whole, partial
+
+
+def snippets(row, query: str, max_fields: int = 2, width: int = SNIPPET_CHARS) -> list:
+    """
+    [(필드, 하이라이트 HTML)] — 질의가 나오는 필드(일치 수 많은 순)마다 첫 일치 주변만 잘라 <mark> 표시.
+    원문은 html.escape 후 표시하므로 그대로 st.markdown(unsafe_allow_html=True)에 써도 된다.
+    """
+    whole, partial = _highlight_pattern(query)
+    if whole is None:
+        return []
+    found = []
+    for field in TEXT_FIELDS:
+        text = unicodedata.normalize("NFKC", str(row.get(field, "") or ""))
+        if not text or text == "nan":
+            continue
+        matches = list(whole.finditer(text)) or list(partial.finditer(text))
+        if matches:
+            found.append((len(matches), field, text, matches))
+    found.sort(key=lambda f: -f[0])
+
+    out = []
+    for _, field, text, matches in found[:max_fields]:
+        start = max(0, matches[0].start() - width)
+        end = min(len(text), matches[0].end() + width)
+        parts, cursor = [], start
+        for m in matches:
+            if m.start() < cursor or m.end() > end:
+                continue
+            parts.append(html.escape(text[cursor:m.start()]))
+            parts.append(f"<mark>{html.escape(m.group())}</mark>")
+            cursor = m.end()
+        parts.append(html.escape(text[cursor:end]))
+        body = "".join(parts).replace("\n", " ")
+        out.append((field, ("…" if start > 0 else "") + body + ("…" if end < len(text) else "")))
+    return out
@@ -0,0 +1,176 @@
+import json
+import os
+import threading
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from rpm_series import RPM_TWA
+
+# ============================
+# 작업기록 이상 감지 (지표별 EWMA 평균/분산 → z-score)
+# ============================
+# data/ops_logs/_anomalies.json ← 지표별 EWMA 상태 + 처리한 마지막 날짜/행 수 + 감지 목록(VOC 연결 포함)
+# 새 기록(마지막 처리 날짜 이후)만 읽어 상태를 이어서 갱신한다.
+# 지난 날짜 소급 입력처럼 행 수가 맞지 않으면 전체를 다시 계산한다(전 구간 벡터 연산).
+ANOMALY_METRICS = [
+    "CSL드레인 COD",
+    "파쇄량(톤/일)",
+    "폐수 처리량(m3)",
+    "수전분 재공(m3)",
+    "LSW재공(m3)",
+    "액화 RPM",
+    RPM_TWA,
+]
+EWMA_SPAN = 14           # 약 2주 기억
+Z_THRESHOLD = 3.0
+WARMUP = 7               # 지표별 관측이 이만큼 쌓이기 전에는 판정하지 않음
+STATE_NAME = "_anomalies.json"
+STATE_VERSION = 1
+
+_ALPHA = 2.0 / (EWMA_SPAN + 1)
+_lock = threading.Lock()
+
+
+def _params() -> dict:
+    return {"span": EWMA_SPAN, "z": Z_THRESHOLD, "warmup": WARMUP, "metrics": ANOMALY_METRICS}
+
+
+def _ewm(seed: float, u: np.ndarray) -> np.ndarray:
+    """y_0 = seed, y_t = (1-α)·y_{t-1} + α·u_t  (pandas ewm(adjust=False)의 C 루프 사용)"""
+    return pd.Series(np.concatenate(([seed], u))).ewm(alpha=_ALPHA, adjust=False).mean().to_numpy()
+
+
+def ewma_zscores(values: np.ndarray, state: dict = None):
+    """
+    한 지표의 값 배열(날짜순, NaN 허용)을 이전 상태에 이어 처리.
+    반환: (기대값 배열, z 배열, 새 상태 {mean, var, count})
+      기대값/z는 해당 값 "직전"까지의 EWMA 평균/분산 기준 — 튀는 값이 자기 자신을 가리지 않게 함.
+    분산은 EW 분산 점화식 v_t = (1-α)(v_{t-1} + α·d_t²),  d_t = x_t - m_{t-1}.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    expected = np.full(len(values), np.nan)
+    z = np.full(len(values), np.nan)
+    state = dict(state or {"mean": None, "var": 0.0, "count": 0})
+
+    pos = np.flatnonzero(~np.isnan(values))
+    x = values[pos]
+    if state["count"] == 0 and len(x):
+        # 첫 관측은 초기값으로만 사용
+        state.update(mean=float(x[0]), var=0.0, count=1)
+        pos, x = pos[1:], x[1:]
+    if not len(x):
+        return expected, z, state
+
+    m = _ewm(state["mean"], x)
+    d = x - m[:-1]
+    v = _ewm(state["var"], (1 - _ALPHA) * d ** 2)
+    seen = state["count"] + np.arange(len(x))
+    sd = np.sqrt(v[:-1])
+    ok = (seen >= WARMUP) & (sd > 0)
+    expected[pos] = m[:-1]
+    z[pos] = np.divide(d, sd, out=np.full(len(x), np.nan), where=ok)
+    state.update(mean=float(m[-1]), var=float(v[-1]), count=int(state["count"] + len(x)))
+    return expected, z, state
+
+
+def detect(df: pd.DataFrame, metric_states: dict = None):
+    """
+    날짜순 기록 → (감지 목록, 지표별 새 상태). 감지 기준 |z| > Z_THRESHOLD.
+    감지 항목: {date, metric, value, expected, z, voc}
+    """
+    metric_states = metric_states or {}
+    dates = pd.to_datetime(df["날짜"]).dt.strftime("%Y-%m-%d").to_numpy() if len(df) else np.array([])
+    flags, states = [], {}
+    for metric in ANOMALY_METRICS:
+        values = (pd.to_numeric(df[metric], errors="coerce").to_numpy(np.float64)
+                  if metric in df.columns else np.full(len(df), np.nan))
+        expected, z, states[metric] = ewma_zscores(values, metric_states.get(metric))
+        for i in np.flatnonzero(np.abs(np.nan_to_num(z)) > Z_THRESHOLD):
+            flags.append({
+                "date": dates[i], "metric": metric, "value": float(values[i]),
+                "expected": round(float(expected[i]), 3), "z": round(float(z[i]), 2), "voc": None,
+            })
+    return flags, states
+
+
+def _state_path(store) -> str:
+    return os.path.join(store.base_dir, STATE_NAME)
+
+
+def load_anomalies(store) -> dict:
+    try:
+        with open(_state_path(store), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save(store, state: dict):
+    path = _state_path(store)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=1)
+    os.replace(tmp, path)
+
+
+def update_anomalies(store) -> dict:
+    """
+    저장소의 새 기록만 감지 단계에 통과시키고 상태/감지 목록을 저장 → 최신 상태 반환.
+    처리한 행 수 + 새 행 수가 저장소 전체 행 수와 다르면(소급 입력/이전 등) 전체 재계산.
+    """
+    with _lock:
+        months = store.months()
+        state = load_anomalies(store)
+        if not months:
+            return state
+        total = sum(store.month_summary(m).get("rows", 0) for m in months)
+        last_date = store.month_summary(months[-1])["last_date"]
+
+        incremental = (
+            state.get("version") == STATE_VERSION and state.get("params") == _params()
+            and state.get("last_date")
+        )
+        if incremental:
+            if state["last_date"] >= last_date and state.get("processed_rows") == total:
+                return state
+            start = pd.Timestamp(state["last_date"]) + pd.Timedelta(days=1)
+            new = store.read_range(start, last_date) if start <= pd.Timestamp(last_date) else None
+            incremental = new is not None and state["processed_rows"] + len(new) == total
+
+        if incremental:
+            flags, metric_states = detect(new, state["metrics"])
+            flags = state["flags"] + flags
+        else:
+            flags, metric_states = detect(store.read_all())
+            # 전체 재계산 시에도 이미 연결된 VOC는 유지
+            links = {(f["date"], f["metric"]): f.get("voc") for f in state.get("flags", [])}
+            for f in flags:
+                f["voc"] = links.get((f["date"], f["metric"]))
+
+        state = {
+            "version": STATE_VERSION, "params": _params(), "last_date": last_date,
+            "processed_rows": total, "metrics": metric_states, "flags": flags,
+        }
+        _save(store, state)
+        return state
+
+
+def link_voc(store, date: str, metric: str, voc_ref: str) -> bool:
+    """감지 항목(날짜, 지표)에 VOC 기록 참조(VOC timestamp)를 연결"""
+    with _lock:
+        state = load_anomalies(store)
+        for f in state.get("flags", []):
+            if f["date"] == date and f["metric"] == metric:
+                f["voc"] = voc_ref
+                _save(store, state)
+                return True
+    return False
+
+
+def flags_frame(state: dict) -> pd.DataFrame:
+    """감지 목록 → 표 (최근 날짜 먼저)"""
+    df = pd.DataFrame(state.get("flags", []), columns=["date", "metric", "value", "expected", "z", "voc"])
+    return df.sort_values(["date", "metric"], ascending=[False, True]).reset_index(drop=True)
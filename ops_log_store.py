@@ -0,0 +1,409 @@
+import csv
+import json
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+
+import pandas as pd
+
+from rpm_series import RPM_SOURCE, RPM_STAT_COLUMNS, RPM_TIMES, RPM_VALUES, parse_rpm_column
+
+try:
+    import fcntl
+except ImportError:   # Windows — 프로세스 간 잠금 없이 스레드 잠금만 사용
+    fcntl = None
+
+try:
+    import pyarrow  # noqa: F401  (streamlit 의존성으로 보통 설치돼 있음)
+    PARTITION_FORMAT = "parquet"
+except ImportError:
+    PARTITION_FORMAT = "pickle"
+
+# ============================
+# 공정 일일 작업기록 저장소 (월별 파티션 + 월 누계 매니페스트)
+# ============================
+# data/ops_logs/2025-01.parquet ← 그 달의 일별 기록 + 월 누계 열 (날짜순, 열 타입 고정)
+# data/ops_logs/_months.json    ← 월별 행 수 / 마지막 날짜 / 누계 합계 / 스키마 버전 / revision
+# 새 날짜를 뒤에 붙일 때는 매니페스트의 합계로 누계를 바로 계산하고(이전 행 재계산 없음),
+# 지난 날짜를 끼워 넣을 때만 그 달을 다시 계산한다. 어느 쪽이든 다시 쓰는 파일은 그 달 하나.
+# 조회는 기간과 겹치는 월 파일만, 페이지 단위로 읽는다.
+OPS_DIR = os.path.join("data", "ops_logs")
+LEGACY_CSV = os.path.join("data", "operation_logs.csv")
+MANIFEST_NAME = "_months.json"
+
+# 파티션 스키마 버전
+#   1: 월별 CSV (열 타입 없음)
+#   2: 월별 parquet/pickle + 아래 OPS_SCHEMA 타입
+#   3: + 파쇄 RPM 시계열(시각/값 배열) 및 일별 최소/평균/최대/시간가중 열
+# 입력 항목이 늘거나 타입이 바뀌면 OPS_SCHEMA를 고치고 버전을 올린다.
+# 예전 버전 파티션은 읽을 때 현재 스키마로 맞추고(없는 열은 빈 값), 다음 조회 때 새 형식으로 옮긴다.
+SCHEMA_VERSION = 3
+
+# 입력 폼(page_ops_log)의 저장 순서
+RECORD_COLUMNS = [
+    "날짜", "파쇄 RPM", "파쇄량(톤/일)", "수전분 재공(m3)", "공침지조(기)",
+    "LSW재공(m3)", "CSL드레인 COD", "공당화(m3)", "액화 RPM",
+    "식품용 생산량(톤)", "산업용 생산량(톤)", "1000m3 레벨", "700m3 레벨", "폐수 처리량(m3)",
+    "201", "301", "701", "801", "250", "양성_Pre", "양성_Final", "D/D",
+    "설비 보수 & 공사 사항", "작업 특기 사항", "입력시각",
+]
+
+# 원본 수치 열 → 월 누계 열
+CUMULATIVE_COLUMNS = {
+    "파쇄량(톤/일)": "파쇄량(누계)",
+    "식품용 생산량(톤)": "식품용 누계(톤)",
+    "산업용 생산량(톤)": "산업용 누계(톤)",
+    "일 생산량(톤)": "전체 누계(톤)",
+}
+
+_NUMERIC_COLUMNS = [
+    "파쇄량(톤/일)", "수전분 재공(m3)", "공침지조(기)", "LSW재공(m3)", "CSL드레인 COD",
+    "공당화(m3)", "액화 RPM", "식품용 생산량(톤)", "산업용 생산량(톤)",
+    "1000m3 레벨", "700m3 레벨", "폐수 처리량(m3)", "일 생산량(톤)",
+    *CUMULATIVE_COLUMNS.values(), *RPM_STAT_COLUMNS,
+]
+_DATETIME_COLUMNS = ["날짜", "입력시각"]
+
+# 열 → dtype (나머지 입력 열은 모두 문자열, "array"는 날짜별 NumPy 배열 — parquet에서는 list 열)
+OPS_SCHEMA = {
+    **{c: "string" for c in RECORD_COLUMNS},
+    **{c: "float64" for c in _NUMERIC_COLUMNS},
+    **{c: "datetime64[ns]" for c in _DATETIME_COLUMNS},
+    RPM_TIMES: "array",
+    RPM_VALUES: "array",
+}
+
+# 화면 표시 순서
+SHOW_COLUMNS = [
+    "날짜",
+    "파쇄 RPM",
+    *RPM_STAT_COLUMNS,
+    "파쇄량(톤/일)",
+    "파쇄량(누계)",
+    "수전분 재공(m3)",
+    "공침지조(기)",
+    "LSW재공(m3)",
+    "CSL드레인 COD",
+    "공당화(m3)",
+    "액화 RPM",
+    "식품용 생산량(톤)",
+    "식품용 누계(톤)",
+    "산업용 생산량(톤)",
+    "산업용 누계(톤)",
+    "일 생산량(톤)",
+    "전체 누계(톤)",
+    "1000m3 레벨",
+    "700m3 레벨",
+    "폐수 처리량(m3)",
+    "201",
+    "301",
+    "701",
+    "801",
+    "250",
+    "양성_Pre",
+    "양성_Final",
+    "D/D",
+    "설비 보수 & 공사 사항",
+    "작업 특기 사항",
+    "입력시각",
+]
+
+_thread_lock = threading.Lock()
+
+
+def month_key(date) -> str:
+    return pd.Timestamp(date).strftime("%Y-%m")
+
+
+def conform_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    어느 버전의 기록이든 현재 OPS_SCHEMA로 맞춤.
+    없는 열은 빈 값으로 추가하고, 스키마에 없는 열(예전 항목)은 버리지 않고 뒤에 둔다.
+    """
+    out = {}
+    for col, dtype in OPS_SCHEMA.items():
+        values = df[col] if col in df.columns else pd.Series(pd.NA, index=df.index, dtype="object")
+        if dtype == "float64":
+            out[col] = pd.to_numeric(values, errors="coerce").astype("float64")
+        elif dtype == "array":
+            out[col] = values.astype(object)
+        elif dtype.startswith("datetime64"):
+            out[col] = pd.to_datetime(values, errors="coerce").astype(dtype)
+        else:
+            out[col] = values.astype("string")
+    extras = [c for c in df.columns if c not in OPS_SCHEMA]
+    return pd.concat([pd.DataFrame(out, index=df.index), df[extras]], axis=1)
+
+
+def derive_month(df: pd.DataFrame) -> pd.DataFrame:
+    """한 달치 기록 → 스키마 정리 + 날짜순 정렬 + 파쇄 RPM 파싱 + 일 생산량 + 월 누계 열 계산"""
+    df = conform_schema(df)
+    df["날짜"] = df["날짜"].dt.normalize()
+    df = df.sort_values("날짜", kind="mergesort").reset_index(drop=True)
+    for col in ["식품용 생산량(톤)", "산업용 생산량(톤)", "파쇄량(톤/일)"]:
+        df[col] = df[col].fillna(0)
+    rpm = parse_rpm_column(df[RPM_SOURCE])
+    for col in rpm.columns:
+        df[col] = rpm[col]
+    df["일 생산량(톤)"] = df["식품용 생산량(톤)"] + df["산업용 생산량(톤)"]
+    for src, cum in CUMULATIVE_COLUMNS.items():
+        df[cum] = df[src].cumsum()
+    return df
+
+
+def _month_totals(df: pd.DataFrame) -> dict:
+    return {src: float(df[src].sum()) for src in CUMULATIVE_COLUMNS}
+
+
+def read_legacy_csv(path: str) -> pd.DataFrame:
+    """
+    헤더를 한 번만 쓰고 계속 append한 operation_logs.csv 읽기.
+    입력 항목이 늘어난 뒤 추가된 행은 필드 수가 헤더와 달라 pd.read_csv가 깨지므로,
+    필드 수가 헤더와 같으면 헤더 기준, 현재 폼(RECORD_COLUMNS)과 같으면 폼 순서 기준으로 맞춘다.
+    어느 쪽과도 맞지 않는 행은 건너뛴다.
+    """
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        layouts = {len(RECORD_COLUMNS): RECORD_COLUMNS, len(header): header}
+        rows = []
+        for fields in reader:
+            cols = layouts.get(len(fields))
+            if cols is not None:
+                rows.append(dict(zip(cols, fields)))
+    df = pd.DataFrame(rows)
+    return df.replace("", pd.NA) if not df.empty else df
+
+
+class OpsLogStore:
+    def __init__(self, base_dir: str = OPS_DIR, legacy_csv: str = LEGACY_CSV):
+        self.base_dir = base_dir
+        self.legacy_csv = legacy_csv
+
+    # ---------- 내부: 경로 / 잠금 / 매니페스트 ----------
+    def _month_path(self, month: str, fmt: str = PARTITION_FORMAT) -> str:
+        ext = {"parquet": "parquet", "pickle": "pkl", "csv": "csv"}[fmt]
+        return os.path.join(self.base_dir, f"{month}.{ext}")
+
+    @staticmethod
+    def _partition_format(meta: dict) -> str:
+        # 형식 정보가 없는 항목은 v1(월별 CSV)
+        return meta.get("format", "csv")
+
+    @contextmanager
+    def _lock(self):
+        os.makedirs(self.base_dir, exist_ok=True)
+        with _thread_lock:
+            if fcntl is None:
+                yield
+                return
+            with open(os.path.join(self.base_dir, ".lock"), "w") as lf:
+                fcntl.flock(lf, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lf, fcntl.LOCK_UN)
+
+    def _load_manifest(self) -> dict:
+        try:
+            with open(os.path.join(self.base_dir, MANIFEST_NAME), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"months": {}}
+
+    def _save_manifest(self, manifest: dict):
+        path = os.path.join(self.base_dir, MANIFEST_NAME)
+        tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, path)
+
+    def _store_month(self, manifest: dict, month: str, df: pd.DataFrame):
+        """누계까지 계산된 한 달치를 현재 형식/스키마로 파일 교체 + 매니페스트 갱신"""
+        df = df.copy()
+        df.attrs["schema_version"] = SCHEMA_VERSION
+        path = self._month_path(month)
+        tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            if PARTITION_FORMAT == "parquet":
+                df.to_parquet(tmp, index=False)
+            else:
+                df.to_pickle(tmp)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        old = manifest["months"].get(month)
+        if old and self._partition_format(old) != PARTITION_FORMAT:
+            old_path = self._month_path(month, self._partition_format(old))
+            if os.path.exists(old_path):
+                os.remove(old_path)
+        manifest["months"][month] = {
+            "rows": len(df),
+            "last_date": df["날짜"].iloc[-1].strftime("%Y-%m-%d"),
+            "totals": _month_totals(df),
+            "format": PARTITION_FORMAT,
+            "schema_version": SCHEMA_VERSION,
+            # 그 달 파일이 바뀔 때마다 1 증가 — 기간별 집계 캐시의 무효화 키
+            "revision": (old or {}).get("revision", 0) + 1,
+        }
+
+    def _write_month(self, manifest: dict, month: str, df: pd.DataFrame):
+        """그 달 전체를 다시 계산해 저장"""
+        self._store_month(manifest, month, derive_month(df))
+
+    def _ensure_migrated(self, manifest: dict):
+        """기존 operation_logs.csv를 최초 1회 월별 파티션으로 옮김 (원본 CSV는 그대로 둠)"""
+        if manifest.get("legacy_migrated"):
+            return False
+        if os.path.exists(self.legacy_csv) and os.path.getsize(self.legacy_csv) > 0:
+            legacy = read_legacy_csv(self.legacy_csv)
+            if "날짜" in legacy.columns:
+                dates = pd.to_datetime(legacy["날짜"], errors="coerce")
+                legacy = legacy[dates.notna()]
+                for month, part in legacy.groupby(dates[dates.notna()].dt.strftime("%Y-%m")):
+                    self._write_month(manifest, month, part)
+        manifest["legacy_migrated"] = True
+        return True
+
+    @staticmethod
+    def _outdated(manifest: dict):
+        return [m for m, meta in manifest["months"].items()
+                if meta.get("schema_version", 1) < SCHEMA_VERSION
+                or meta.get("format", "csv") != PARTITION_FORMAT]
+
+    def _upgrade_partitions(self, manifest: dict):
+        """예전 스키마/형식 파티션을 현재 형식으로 다시 씀 (누계는 다시 계산)"""
+        outdated = self._outdated(manifest)
+        for month in outdated:
+            self._write_month(manifest, month, self.read_month(month, manifest))
+        return bool(outdated)
+
+    # ---------- 쓰기 ----------
+    def append_day(self, rec: dict) -> str:
+        """
+        하루치 기록 저장 → 저장된 월(YYYY-MM) 반환.
+        그 달의 마지막 날짜 이후면 누계를 매니페스트 합계로 계산해 한 행만 덧붙이고,
+        이전 날짜(소급 입력)면 그 달만 다시 계산한다.
+        """
+        month = month_key(rec["날짜"])
+        with self._lock():
+            manifest = self._load_manifest()
+            self._ensure_migrated(manifest)
+            self._upgrade_partitions(manifest)
+            meta = manifest["months"].get(month)
+            date = pd.Timestamp(rec["날짜"]).strftime("%Y-%m-%d")
+            current = self.read_month(month, manifest) if meta else pd.DataFrame()
+
+            if meta and date >= meta["last_date"]:
+                row = derive_month(pd.DataFrame([rec]))
+                for src, cum in CUMULATIVE_COLUMNS.items():
+                    row[cum] = meta["totals"].get(src, 0.0) + float(row[src].iloc[0])
+                self._store_month(manifest, month, pd.concat([current, row], ignore_index=True))
+            else:
+                self._write_month(manifest, month, pd.concat([current, pd.DataFrame([rec])], ignore_index=True))
+            self._save_manifest(manifest)
+        return month
+
+    # ---------- 읽기 ----------
+    def months(self):
+        """저장된 월 목록 — 예전 CSV/파티션이 남아 있으면 이때 한 번 옮긴다"""
+        manifest = self._load_manifest()
+        legacy_pending = not manifest.get("legacy_migrated") and os.path.exists(self.legacy_csv)
+        if legacy_pending or self._outdated(manifest):
+            with self._lock():
+                manifest = self._load_manifest()
+                changed = self._ensure_migrated(manifest)
+                changed = self._upgrade_partitions(manifest) or changed
+                if changed:
+                    self._save_manifest(manifest)
+        return sorted(manifest["months"])
+
+    def read_month(self, month: str, manifest: dict = None) -> pd.DataFrame:
+        """한 달치 파티션 — 파티션 스키마 버전이 현재와 다르면 현재 스키마로 맞춰 반환"""
+        meta = (manifest or self._load_manifest())["months"].get(month, {})
+        fmt = self._partition_format(meta)
+        path = self._month_path(month, fmt)
+        if fmt == "parquet":
+            df = pd.read_parquet(path)
+        elif fmt == "pickle":
+            df = pd.read_pickle(path)
+        else:
+            df = pd.read_csv(path, encoding="utf-8-sig")
+        if meta.get("schema_version", 1) != SCHEMA_VERSION:
+            df = conform_schema(df)
+        return df
+
+    def month_summary(self, month: str) -> dict:
+        """매니페스트의 월 요약 {rows, last_date, totals, ...} — 파일을 열지 않음"""
+        return self._load_manifest()["months"].get(month, {})
+
+    def months_between(self, start, end):
+        """[start, end] 날짜 구간과 겹치는 월 목록 (오름차순)"""
+        lo, hi = month_key(start), month_key(end)
+        return [m for m in self.months() if lo <= m <= hi]
+
+    def range_revisions(self, start, end):
+        """구간 내 월별 (월, revision) 튜플 — 다른 달에 추가된 기록은 이 값을 바꾸지 않음"""
+        months = self.months_between(start, end)
+        manifest = self._load_manifest()["months"]
+        return tuple((m, manifest[m].get("revision", 0)) for m in months)
+
+    @staticmethod
+    def _clip(df: pd.DataFrame, start, end) -> pd.DataFrame:
+        dates = df["날짜"]
+        return df[(dates >= pd.Timestamp(start).normalize()) & (dates <= pd.Timestamp(end).normalize())]
+
+    def read_range(self, start, end) -> pd.DataFrame:
+        """구간과 겹치는 월 파일만 읽어 날짜로 자름"""
+        parts = [self.read_month(m) for m in self.months_between(start, end)]
+        if not parts:
+            return conform_schema(pd.DataFrame(columns=SHOW_COLUMNS))
+        return self._clip(pd.concat(parts, ignore_index=True), start, end).reset_index(drop=True)
+
+    def _range_counts(self, start, end):
+        """
+        구간 내 월별 행 수 → ([(월, 행 수), ...], {경계 월: 잘라낸 DataFrame}).
+        구간 안에 완전히 들어가는 월은 매니페스트 행 수만 쓰고 파일을 열지 않는다.
+        """
+        lo = pd.Timestamp(start).strftime("%Y-%m-%d")
+        hi = pd.Timestamp(end).strftime("%Y-%m-%d")
+        months = self.months_between(start, end)
+        manifest = self._load_manifest()
+        counts, loaded = [], {}
+        for m in months:
+            meta = manifest["months"][m]
+            if f"{m}-01" >= lo and meta["last_date"] <= hi:
+                counts.append((m, meta["rows"]))
+            else:
+                loaded[m] = self._clip(self.read_month(m, manifest), start, end)
+                counts.append((m, len(loaded[m])))
+        return counts, loaded
+
+    def count_range(self, start, end) -> int:
+        return sum(n for _, n in self._range_counts(start, end)[0])
+
+    def read_range_page(self, start, end, page: int, page_size: int) -> pd.DataFrame:
+        """구간 내 기록의 page번째(1부터) 묶음 — 그 페이지가 걸치는 월 파일만 읽음"""
+        counts, loaded = self._range_counts(start, end)
+        first = (max(page, 1) - 1) * page_size
+        last = first + page_size
+        parts, pos = [], 0
+        for m, n in counts:
+            if pos + n > first and pos < last:
+                df = loaded[m] if m in loaded else self.read_month(m)
+                parts.append(df.iloc[max(first - pos, 0):last - pos])
+            pos += n
+            if pos >= last:
+                break
+        if not parts:
+            return conform_schema(pd.DataFrame(columns=SHOW_COLUMNS))
+        return pd.concat(parts, ignore_index=True)
+
+    def read_all(self) -> pd.DataFrame:
+        """누계까지 계산돼 있는 월 파일을 이어붙이기만 함 (재계산 없음, 열은 합집합)"""
+        parts = [self.read_month(m) for m in self.months()]
+        if not parts:
+            return conform_schema(pd.DataFrame(columns=SHOW_COLUMNS))
+        return pd.concat(parts, ignore_index=True)
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+
+from rpm_series import RPM_TWA
+
+# ============================
+# 공정 트렌드 집계 (일/주/월 + 이동평균) + LTTB 다운샘플링
+# ============================
+# 집계 결과는 앱에서 (지표, 단위, 기간, 구간 내 월별 revision) 키로 캐시한다.
+# 긴 기간은 LTTB로 MAX_POINTS개 이하로 줄여 브라우저로 보내는 점 수를 제한한다.
+TREND_METRICS = [
+    "파쇄량(톤/일)",
+    RPM_TWA,
+    "수전분 재공(m3)",
+    "LSW재공(m3)",
+    "CSL드레인 COD",
+    "액화 RPM",
+    "폐수 처리량(m3)",
+    "1000m3 레벨",
+    "700m3 레벨",
+]
+
+# 단위 → (resample 주기, 이동평균 구간 수)
+GRANULARITIES = {
+    "일별": ("D", 7),
+    "주별": ("W-MON", 4),
+    "월별": ("MS", 3),
+}
+
+MAX_POINTS = 500
+
+
+def trend_series(df: pd.DataFrame, metric: str, granularity: str) -> pd.DataFrame:
+    """
+    작업기록 → 날짜 index의 [지표 일평균, 이동평균] 프레임.
+    주/월 단위는 기간 내 일평균(기록이 없는 날은 제외)이라 단위가 달라도 값의 크기가 같다.
+    """
+    freq, window = GRANULARITIES[granularity]
+    if df.empty or metric not in df.columns:
+        return pd.DataFrame(columns=[metric, f"{window}구간 이동평균"])
+    s = pd.Series(
+        pd.to_numeric(df[metric], errors="coerce").to_numpy(),
+        index=pd.to_datetime(df["날짜"]),
+    ).dropna().sort_index()
+    if freq != "D":
+        s = s.resample(freq).mean().dropna()
+    else:
+        # 같은 날 기록이 여러 건이면 평균
+        s = s.groupby(level=0).mean()
+    out = pd.DataFrame({metric: s})
+    out[f"{window}구간 이동평균"] = s.rolling(window, min_periods=1).mean()
+    out.index.name = "날짜"
+    return out
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets — 시각적 모양을 유지하는 n_out개 점의 위치(index) 반환.
+    처음/마지막 점은 항상 포함. 버킷 단위 루프(n_out회) 안은 NumPy 벡터 연산.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)   # 가운데 n_out-2개 버킷 경계
+    picked = np.empty(n_out, dtype=np.int64)
+    picked[0], picked[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # 다음 버킷 평균 (마지막 버킷이면 마지막 점)
+        nlo, nhi = hi, edges[i + 2] if i + 2 < len(edges) else n
+        cx, cy = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(np.argmax(area))
+        picked[i + 1] = a
+    return picked
+
+
+def downsample(frame: pd.DataFrame, max_points: int = MAX_POINTS) -> pd.DataFrame:
+    """첫 열(원 지표) 기준 LTTB로 고른 행만 남김 — 이동평균 열도 같은 날짜로 맞춰 함께 보냄"""
+    if len(frame) <= max_points:
+        return frame
+    x = frame.index.asi8 / 1e9
+    return frame.iloc[lttb(x, frame.iloc[:, 0].to_numpy(), max_points)]
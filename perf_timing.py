@@ -0,0 +1,59 @@
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+# ============================
+# 시작/rerun 단계별 시간 측정 (ms)
+# ============================
+# 앱 스크립트는 rerun마다 다시 실행되지만 이 모듈은 프로세스당 한 번만 import된다.
+# 그래서 첫 실행(cold)과 이후 rerun(warm)을 구분하고, 첫 import 시점부터 첫 렌더 완료까지도 잴 수 있다.
+# INCHON1_TIMING=1 이면 매 실행을 stderr에 한 줄로 남기고, URL에 ?timing=1 이면 사이드바에도 표시.
+# benchmarks/bench_startup.py 는 LAST_REPORT 를 읽어 페이지별 cold/warm 표를 만든다.
+PROCESS_START = time.perf_counter()
+LOG_ENABLED = os.environ.get("INCHON1_TIMING", "") not in ("", "0")
+
+LAST_REPORT = None
+_runs = 0
+
+
+class RunTimer:
+    """한 번의 스크립트 실행 — phase(name) 블록마다 경과 시간을 기록"""
+
+    def __init__(self):
+        global _runs
+        self.cold = _runs == 0
+        _runs += 1
+        self.started = time.perf_counter()
+        self.phases = []
+
+    @contextmanager
+    def phase(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, (time.perf_counter() - t0) * 1000))
+
+    def finish(self, page: str = "") -> dict:
+        global LAST_REPORT
+        now = time.perf_counter()
+        report = {
+            "page": page,
+            "cold": self.cold,
+            "phases": dict(self.phases),
+            "total_ms": (now - self.started) * 1000,
+        }
+        if self.cold:
+            report["since_import_ms"] = (now - PROCESS_START) * 1000
+        LAST_REPORT = report
+        if LOG_ENABLED:
+            print(format_report(report), file=sys.stderr, flush=True)
+        return report
+
+
+def format_report(report: dict) -> str:
+    """[timing] page=제품백서 cold total=123.4ms | config 0.2 · auth 0.1 · ..."""
+    phases = " · ".join(f"{name} {ms:.1f}" for name, ms in report["phases"].items())
+    kind = "cold" if report["cold"] else "warm"
+    return f"[timing] page={report['page']} {kind} total={report['total_ms']:.1f}ms | {phases}"
@@ -0,0 +1,145 @@
+import hashlib
+import json
+import os
+import uuid
+
+import pandas as pd
+
+from product_hierarchy import classify_hierarchy
+
+# ============================
+# product_data.csv 바이너리 캐시 (mtime/size/해시 기준 무효화)
+# ============================
+PRODUCT_CSV = "product_data.csv"
+CACHE_DIR = os.path.join("data", ".cache")
+
+# prepare_product_df 처리 내용이 바뀌면 올려서 기존 캐시를 버린다
+CACHE_VERSION = 1
+
+try:
+    import pyarrow  # noqa: F401  (streamlit 의존성으로 보통 설치돼 있음)
+    CACHE_FORMAT = "parquet"
+except ImportError:
+    CACHE_FORMAT = "pickle"
+
+
+def prepare_product_df(df: pd.DataFrame) -> pd.DataFrame:
+    """CSV 원본 → 앱에서 쓰는 형태 (용도 구분자 정리 + 계층구조 자동 생성)"""
+    if "용도" in df.columns:
+        df["용도"] = df["용도"].astype(str).str.replace(r"\s*-\s*", " / ", regex=True)
+    if "계층구조_2레벨" not in df.columns or "계층구조_3레벨" not in df.columns:
+        # 규칙표(product_hierarchy.HIERARCHY_RULES) 기준으로 코드 열 전체를 한 번에 분류
+        df[["계층구조_2레벨", "계층구조_3레벨"]] = classify_hierarchy(df["제품코드"]).to_numpy()
+    return df
+
+
+def csv_signature(csv_path: str = PRODUCT_CSV):
+    """(mtime_ns, size) — 파일이 없으면 None. 매 rerun마다 불러도 stat 한 번뿐"""
+    try:
+        st_ = os.stat(csv_path)
+    except OSError:
+        return None
+    return (st_.st_mtime_ns, st_.st_size)
+
+
+def _sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _cache_paths(csv_path: str, cache_dir: str):
+    base = os.path.splitext(os.path.basename(csv_path))[0]
+    ext = "parquet" if CACHE_FORMAT == "parquet" else "pkl"
+    return os.path.join(cache_dir, f"{base}.{ext}"), os.path.join(cache_dir, f"{base}.meta.json")
+
+
+def _atomic_write(path: str, write):
+    """임시 파일에 쓴 뒤 os.replace — 여러 세션이 동시에 써도 깨진 파일이 보이지 않음"""
+    tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _read_meta(meta_path: str):
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_meta(meta_path: str, meta: dict):
+    def _w(tmp):
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+    _atomic_write(meta_path, _w)
+
+
+def catalogue_version(csv_path: str = PRODUCT_CSV, cache_dir: str = CACHE_DIR) -> str:
+    """CSV 내용 SHA-256 — 캐시 메타의 (mtime, size)가 지금과 같으면 해시를 다시 계산하지 않음"""
+    meta = _read_meta(_cache_paths(csv_path, cache_dir)[1])
+    if meta and meta.get("sha256") and (meta.get("mtime_ns"), meta.get("size")) == csv_signature(csv_path):
+        return meta["sha256"]
+    return _sha256(csv_path)
+
+
+def _read_frame(data_path: str) -> pd.DataFrame:
+    if CACHE_FORMAT == "parquet":
+        return pd.read_parquet(data_path)
+    return pd.read_pickle(data_path)
+
+
+def _write_frame(data_path: str, df: pd.DataFrame):
+    if CACHE_FORMAT == "parquet":
+        _atomic_write(data_path, lambda tmp: df.to_parquet(tmp, index=False))
+    else:
+        _atomic_write(data_path, lambda tmp: df.to_pickle(tmp))
+
+
+def read_product_frame(csv_path: str = PRODUCT_CSV, cache_dir: str = CACHE_DIR) -> pd.DataFrame:
+    """
+    가공이 끝난 제품 DataFrame을 반환.
+    캐시 메타의 (mtime, size)가 같으면 바로 캐시를 읽고, 다르면 SHA-256까지 비교해
+    내용이 실제로 바뀐 경우에만 CSV를 다시 파싱한다. 캐시 쓰기 실패는 무시(읽기만 느려짐).
+    """
+    sig = csv_signature(csv_path)
+    if sig is None:
+        raise FileNotFoundError(csv_path)
+    data_path, meta_path = _cache_paths(csv_path, cache_dir)
+    meta = _read_meta(meta_path)
+
+    if meta and meta.get("version") == CACHE_VERSION and os.path.exists(data_path):
+        same_stat = (meta.get("mtime_ns"), meta.get("size")) == sig
+        digest = None if same_stat else _sha256(csv_path)
+        if same_stat or digest == meta.get("sha256"):
+            try:
+                df = _read_frame(data_path)
+            except Exception:
+                df = None
+            if df is not None:
+                if not same_stat:
+                    # 내용은 그대로이고 mtime만 바뀐 경우(touch, git checkout) → 메타만 갱신
+                    try:
+                        _write_meta(meta_path, {**meta, "mtime_ns": sig[0], "size": sig[1]})
+                    except OSError:
+                        pass
+                return df
+
+    df = prepare_product_df(pd.read_csv(csv_path, encoding="utf-8"))
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        _write_frame(data_path, df)
+        _write_meta(meta_path, {
+            "version": CACHE_VERSION, "format": CACHE_FORMAT,
+            "mtime_ns": sig[0], "size": sig[1], "sha256": _sha256(csv_path),
+        })
+    except Exception:
+        pass
+    return df
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+
+# ============================
+# 제품코드 → 계층구조(2레벨/3레벨) 규칙표
+# ============================
+# (접두어 또는 접두어 튜플, 2레벨, 3레벨)
+# 겹치는 접두어(GIC002 / GIC 등)는 "가장 긴 접두어 우선"으로 판정하므로 순서와 무관하다.
+HIERARCHY_RULES = [
+    ("GIB", "FG0009 : 부산물", "부산물"),
+    (("GID1", "GID2", "GID3"), "FG0001 : 포도당", "포도당분말"),
+    (("GID6", "GID7"), "FG0001 : 포도당", "포도당액상"),
+    ("GIS62", "FG0002 : 물엿", "고감미75"),
+    (("GIS601", "GIS631"), "FG0002 : 물엿", "고감미82"),
+    (("GIS701", "GIS703"), "FG0002 : 물엿", "일반75"),
+    ("GIS401", "FG0002 : 물엿", "일반82"),
+    ("GIS201", "FG0002 : 물엿", "저당물엿"),
+    ("GIS22", "FG0002 : 물엿", "제네덱스"),
+    ("GIS23", "FG0002 : 물엿", "가루엿"),
+    ("GIS90", "FG0002 : 물엿", "맥아82"),
+    ("GIS92", "FG0002 : 물엿", "맥아75"),
+    ("GIS93", "FG0002 : 물엿", "하이말토스"),
+    (("GIF501", "GIF502"), "FG0003 : 과당", "55%과당"),
+    ("GIC002", "FG0004 : 전분", "일반전분"),
+    (("GIC", "GIT"), "FG0004 : 전분", "변성전분"),
+    ("GISQ190", "FG0006 : 알룰로스", "알룰로스 액상"),
+    (("GIN121", "GIN1221"), "FG0007 : 올리고당", "이소말토올리고 액상"),
+    (("GIN1230", "GIN1220"), "FG0007 : 올리고당", "이소말토올리고 분말"),
+    ("GIN131", "FG0007 : 올리고당", "갈락토"),
+    ("GIN151", "FG0007 : 올리고당", "말토올리고"),
+    (("GIP202", "GIP204"), "FG0008 : 식이섬유", "폴리덱스트로스"),
+    (("GIS242", "GIS240"), "FG0008 : 식이섬유", "NMD 액상/분말"),
+]
+DEFAULT_HIERARCHY = ("기타", "기타")
+
+
+def _compile_rules(rules):
+    """규칙표 → (접두어 길이별 {접두어: 규칙번호}, 2레벨 배열, 3레벨 배열)"""
+    by_length = {}
+    level2, level3 = [], []
+    for rule_no, (prefixes, lvl2, lvl3) in enumerate(rules):
+        if isinstance(prefixes, str):
+            prefixes = (prefixes,)
+        for prefix in prefixes:
+            by_length.setdefault(len(prefix), {})[prefix] = rule_no
+        level2.append(lvl2)
+        level3.append(lvl3)
+    # 마지막 칸은 기본값 → 규칙번호 -1이 그대로 '기타'를 가리킴
+    level2.append(DEFAULT_HIERARCHY[0])
+    level3.append(DEFAULT_HIERARCHY[1])
+    lengths = sorted(by_length, reverse=True)
+    return [(n, by_length[n]) for n in lengths], np.array(level2, dtype=object), np.array(level3, dtype=object)
+
+
+_PREFIX_TABLE, _LEVEL2, _LEVEL3 = _compile_rules(HIERARCHY_RULES)
+
+
+def classify_hierarchy(codes: pd.Series) -> pd.DataFrame:
+    """
+    제품코드 Series 전체를 한 번에 분류 (행마다 Series를 만들지 않음).
+    고유 코드만 골라 긴 접두어부터 길이별로 한 번씩 매핑한다.
+    """
+    uniques_idx, uniques = pd.factorize(codes.astype("string"), use_na_sentinel=True)
+    heads = pd.Series(uniques, dtype="string")
+    rule_no = np.full(len(heads), -1, dtype=np.int64)
+    for length, table in _PREFIX_TABLE:
+        todo = rule_no == -1
+        if not todo.any():
+            break
+        hit = heads[todo].str[:length].map(table)
+        rule_no[todo] = hit.fillna(-1).to_numpy(dtype=np.int64)
+
+    # NaN 코드(factorize → -1)도 기본값 칸(-1)으로 떨어지게 끝에 하나 덧붙임
+    per_row = np.append(rule_no, -1)[uniques_idx]
+    return pd.DataFrame(
+        {"계층구조_2레벨": _LEVEL2[per_row], "계층구조_3레벨": _LEVEL3[per_row]},
+        index=codes.index,
+    )
@@ -0,0 +1,38 @@
+from collections import namedtuple
+
+import pandas as pd
+
+# ============================
+# 제품 선택 위젯 옵션 ("코드 | 제품명") — 카탈로그 버전당 한 번만 생성
+# ============================
+# 서류 요청 / VOC / 작업기록 화면의 selectbox·multiselect가 같은 목록을 공유한다.
+# label_by_code 는 저장된 ref_product 문자열("코드 | 이름, 코드 | 이름" 또는 "코드, 코드")을
+# 다시 읽을 때 코드 → 표시 라벨을 O(1)로 찾는 데 쓴다.
+ProductOptions = namedtuple("ProductOptions", "labels label_by_code")
+
+EMPTY_OPTIONS = ProductOptions([], {})
+
+
+def build_product_options(df: pd.DataFrame) -> ProductOptions:
+    """제품 프레임 → ProductOptions(정렬·중복 제거된 라벨 목록, 코드 → 라벨)"""
+    if df is None or df.empty or not {"제품코드", "제품명"}.issubset(df.columns):
+        return EMPTY_OPTIONS
+    codes = df["제품코드"].astype(str).str.strip()
+    labels = codes + " | " + df["제품명"].astype(str).str.strip()
+    pairs = (pd.DataFrame({"code": codes, "label": labels})
+             .drop_duplicates("label")
+             .sort_values("label"))
+    # 같은 코드에 이름이 여러 개면 정렬상 첫 라벨
+    label_by_code = dict(zip(pairs["code"][::-1], pairs["label"][::-1]))
+    return ProductOptions(pairs["label"].tolist(), label_by_code)
+
+
+def parse_ref_codes(ref) -> list:
+    """저장된 ref_product → 제품코드 목록 (파이프(|) 유무와 상관없이 앞부분을 코드로 인식)"""
+    tokens = [t.strip() for t in str(ref or "").split(",") if t.strip()]
+    return [t.split("|")[0].strip() for t in tokens]
+
+
+def ref_labels(ref, label_by_code: dict) -> list:
+    """저장된 ref_product → 표시 라벨 목록 (카탈로그에 없는 코드는 코드 그대로)"""
+    return [label_by_code.get(code, code) for code in parse_ref_codes(ref)]
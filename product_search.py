@@ -0,0 +1,163 @@
+import bisect
+import re
+import unicodedata
+from collections import defaultdict
+
+import pandas as pd
+
+# ============================
+# 제품 검색 인덱스 (제품코드 / 제품명)
+# ============================
+# 한글 음절(가~힣)의 초성 19자 — 유니코드 배열 순서 그대로
+CHOSEONG = [
+    "ㄱ", "ㄲ", "ㄴ", "ㄷ", "ㄸ", "ㄹ", "ㅁ", "ㅂ", "ㅃ", "ㅅ",
+    "ㅆ", "ㅇ", "ㅈ", "ㅉ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+]
+_CHOSEONG_SET = set(CHOSEONG)
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_WS = re.compile(r"\s+")
+# NFKC는 호환 자모(ㄱ)를 첫가끝 자모(U+1100~)로 바꾸므로 초성 검색용으로 되돌림
+_JAMO_TO_COMPAT = {0x1100 + i: ch for i, ch in enumerate(CHOSEONG)}
+
+# 검색 결과 순위 (작을수록 위)
+RANK_CODE_EXACT = 0
+RANK_CODE_PREFIX = 1
+RANK_CODE_SUBSTR = 2
+RANK_NAME_SUBSTR = 3
+RANK_NAME_CHOSEONG = 4
+
+
+def normalize_text(value) -> str:
+    """NFKC 정규화 + 소문자 + 공백 제거 (NaN → '')"""
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return ""
+    text = unicodedata.normalize("NFKC", str(value))
+    return _WS.sub("", text).lower().translate(_JAMO_TO_COMPAT)
+
+
+def to_choseong(text: str) -> str:
+    """'포도당' → 'ㅍㄷㄷ' (한글 음절만 초성으로 바꾸고 나머지는 그대로)"""
+    out = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            out.append(CHOSEONG[(code - _HANGUL_BASE) // 588])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def is_choseong_query(text: str) -> bool:
+    return bool(text) and all(ch in _CHOSEONG_SET for ch in text)
+
+
+def _grams(text: str):
+    """1-gram + 2-gram 집합 (후보 추리기용)"""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+def _query_grams(text: str):
+    """질의는 2-gram만 써도 충분 (1글자 질의만 1-gram)"""
+    if len(text) == 1:
+        return {text}
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class _GramField:
+    """한 필드(코드/이름/초성)의 n-gram 역색인 — 후보를 좁힌 뒤 부분문자열로 재확인"""
+
+    def __init__(self, values):
+        self.values = values
+        self.postings = defaultdict(set)
+        for pos, text in enumerate(values):
+            for g in _grams(text):
+                self.postings[g].add(pos)
+
+    def find(self, query: str):
+        grams = sorted(_query_grams(query), key=lambda g: len(self.postings.get(g, ())))
+        if not grams:
+            return set()
+        candidates = self.postings.get(grams[0])
+        if not candidates:
+            return set()
+        candidates = set(candidates)
+        for g in grams[1:]:
+            candidates &= self.postings.get(g, set())
+            if not candidates:
+                return set()
+        return {pos for pos in candidates if query in self.values[pos]}
+
+
+class ProductSearchIndex:
+    """
+    제품코드/제품명 검색 인덱스. load_product_df 결과(행 순서)로 한 번만 만들고,
+    search()는 df.iloc에 바로 쓸 수 있는 행 위치(position) 목록을 돌려준다.
+    순위: 코드 일치 → 코드 접두어 → 코드 부분일치 → 제품명 부분일치 → 초성 일치
+    """
+
+    def __init__(self, codes, names):
+        self.size = len(codes)
+        self._codes = _GramField([normalize_text(c) for c in codes])
+        self._names = _GramField([normalize_text(n) for n in names])
+        self._choseong = _GramField([to_choseong(n) for n in self._names.values])
+
+        self._code_exact = defaultdict(list)
+        for pos, code in enumerate(self._codes.values):
+            if code:
+                self._code_exact[code].append(pos)
+        # 접두어 검색용 정렬 배열 (bisect)
+        self._sorted_codes = sorted(
+            (code, pos) for pos, code in enumerate(self._codes.values) if code
+        )
+        self._sorted_keys = [code for code, _ in self._sorted_codes]
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame):
+        if df.empty:
+            return cls([], [])
+        codes = df["제품코드"].tolist() if "제품코드" in df.columns else [""] * len(df)
+        names = df["제품명"].tolist() if "제품명" in df.columns else [""] * len(df)
+        return cls(codes, names)
+
+    def _code_prefix(self, query: str):
+        lo = bisect.bisect_left(self._sorted_keys, query)
+        hi = bisect.bisect_left(self._sorted_keys, query + "\uffff")
+        return [pos for _, pos in self._sorted_codes[lo:hi]]
+
+    def search_ranked(self, query):
+        """[(rank, pos), ...] — rank 오름차순, 같은 rank는 원래 행 순서"""
+        q = normalize_text(query)
+        if not q:
+            return []
+        best = {}
+
+        def _add(positions, rank):
+            for pos in positions:
+                if pos not in best or rank < best[pos]:
+                    best[pos] = rank
+
+        _add(self._code_exact.get(q, ()), RANK_CODE_EXACT)
+        _add(self._code_prefix(q), RANK_CODE_PREFIX)
+        _add(self._codes.find(q), RANK_CODE_SUBSTR)
+        _add(self._names.find(q), RANK_NAME_SUBSTR)
+        if is_choseong_query(q):
+            _add(self._choseong.find(q), RANK_NAME_CHOSEONG)
+        return sorted(((rank, pos) for pos, rank in best.items()))
+
+    def search(self, query, limit=None):
+        positions = [pos for _, pos in self.search_ranked(query)]
+        return positions[:limit] if limit else positions
+
+    def search_many(self, queries, limit=None):
+        """여러 검색어 결과를 중복 없이 이어붙임 (앞 검색어 결과 우선)"""
+        seen = set()
+        out = []
+        for q in queries:
+            for pos in self.search(q):
+                if pos not in seen:
+                    seen.add(pos)
+                    out.append(pos)
+        return out[:limit] if limit else out
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+# ============================
+# 파쇄 RPM 자유 입력 → 시계열 (시각, 회전수) + 일별 통계
+# ============================
+# 입력 예: "08:00-1500, 10:00-1600" / 줄바꿈 구분 / "8:30~1550"
+# 저장 시 한 번만 파싱해 작업기록 파티션에 배열 열과 통계 열로 함께 넣는다
+# (화면에서는 문자열을 다시 파싱하지 않음).
+RPM_SOURCE = "파쇄 RPM"
+RPM_TIMES = "파쇄 RPM 시각(분)"     # 자정 기준 분 (int16 배열)
+RPM_VALUES = "파쇄 RPM 값"          # 회전수 (float64 배열)
+RPM_MIN = "파쇄 RPM 최소"
+RPM_MEAN = "파쇄 RPM 평균"
+RPM_MAX = "파쇄 RPM 최대"
+RPM_TWA = "파쇄 RPM 시간가중"       # 측정 시각 사이를 선형 보간한 시간가중 평균
+RPM_STAT_COLUMNS = [RPM_MIN, RPM_MEAN, RPM_MAX, RPM_TWA]
+
+_PATTERN = r"(?P<h>\d{1,2})\s*:\s*(?P<m>\d{2})\s*[-~]\s*(?P<rpm>\d+(?:\.\d+)?)"
+
+
+def parse_rpm_column(text: pd.Series) -> pd.DataFrame:
+    """
+    파쇄 RPM 문자열 열 전체를 한 번에 파싱 (str.extractall + NumPy 그룹 연산).
+    반환: text와 같은 index의 DataFrame
+      RPM_TIMES / RPM_VALUES : 시각순 정렬된 배열 (측정값 없으면 빈 배열)
+      RPM_MIN / MEAN / MAX / TWA : float (측정값 없으면 NaN)
+    시간가중 평균은 측정 시각 사이를 선형으로 잇는 사다리꼴 적분 / 측정 구간 길이.
+    측정이 한 번뿐이거나 모두 같은 시각이면 단순 평균과 같다.
+    """
+    n = len(text)
+    found = text.astype("string").fillna("").str.extractall(_PATTERN)
+    if found.empty:
+        row = np.empty(0, dtype=np.int64)
+        minutes = np.empty(0, dtype=np.int16)
+        rpm = np.empty(0, dtype=np.float64)
+    else:
+        row = text.index.get_indexer(found.index.get_level_values(0))
+        minutes = (found["h"].astype(int) * 60 + found["m"].astype(int)).to_numpy(np.int16)
+        rpm = found["rpm"].astype(float).to_numpy()
+        # 같은 날 안에서 시각순 정렬 (입력 순서가 뒤섞여 있어도 됨)
+        order = np.lexsort((minutes, row))
+        row, minutes, rpm = row[order], minutes[order], rpm[order]
+
+    counts = np.bincount(row, minlength=n)
+    starts = np.cumsum(counts) - counts
+    has = counts > 0
+
+    stats = {c: np.full(n, np.nan) for c in RPM_STAT_COLUMNS}
+    if has.any():
+        idx = starts[has]
+        stats[RPM_MIN][has] = np.minimum.reduceat(rpm, idx)
+        stats[RPM_MAX][has] = np.maximum.reduceat(rpm, idx)
+        stats[RPM_MEAN][has] = np.add.reduceat(rpm, idx) / counts[has]
+
+        # 인접한 두 측정(같은 날)끼리 사다리꼴 넓이
+        same_day = row[1:] == row[:-1]
+        dt = np.where(same_day, np.diff(minutes.astype(np.float64)), 0.0)
+        area = dt * (rpm[1:] + rpm[:-1]) / 2
+        span = np.bincount(row[:-1], weights=dt, minlength=n)
+        integral = np.bincount(row[:-1], weights=area, minlength=n)
+        twa = np.divide(integral, span, out=stats[RPM_MEAN].copy(), where=span > 0)
+        stats[RPM_TWA][has] = twa[has]
+
+    # 날짜별 배열 열 (같은 길이 배열끼리 2차원으로 합쳐지지 않도록 object 배열에 직접 담음)
+    times_col = np.empty(n, dtype=object)
+    values_col = np.empty(n, dtype=object)
+    bounds = np.cumsum(counts)[:-1]
+    if n:
+        for i, (t, v) in enumerate(zip(np.split(minutes, bounds), np.split(rpm, bounds))):
+            times_col[i], values_col[i] = t, v
+    return pd.DataFrame({RPM_TIMES: times_col, RPM_VALUES: values_col, **stats}, index=text.index)
@@ -0,0 +1,319 @@
+"""
+한도견본 이미지 로컬 캐시 (원격 원본 1회 다운로드 → 썸네일 생성 → static/samples 에서 서빙)
+
+    python sample_images.py prefetch                      # product_data.csv 의 한도견본 전체 미리 받기
+    python sample_images.py prefetch --refresh            # 원격이 바뀌었는지 ETag로 다시 확인
+    python sample_images.py prefetch --upstream http://127.0.0.1:8765
+    python sample_images.py serve --dir 이미지폴더 --port 8765
+
+카드는 캐시된 이미지면 썸네일(/app/static/samples/...)을 보여 주고, 원본은 모달을 열 때만 읽는다.
+캐시에 없는 이미지는 원격 URL을 그대로 쓴다 (온라인일 때만 보임).
+파일 이름이 내용 해시라 같은 URL은 내용이 바뀌지 않는 한 영구 캐시해도 된다.
+serve 는 ETag/If-None-Match(304)와 immutable 캐시 헤더를 주는 작은 HTTP 서버다.
+static/samples 를 서빙하면 사내 이미지 프록시(INCHON1_SAMPLE_BASE_URL)로,
+원격과 같은 경로의 폴더를 서빙하면 prefetch --upstream 과 묶어 네트워크 없는 원격 대역(테스트용)으로 쓴다.
+"""
+import argparse
+import hashlib
+import http.client
+import io
+import json
+import mimetypes
+import os
+import re
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+import uuid
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from assets import STATIC_DIR, STATIC_URL
+
+SAMPLE_DIR = os.path.join(STATIC_DIR, "samples")
+# Streamlit 정적 서빙은 ETag만 주고 304/Cache-Control은 없다. 장기 캐시가 필요하면
+# `serve --dir static/samples` 를 따로 띄우고 그 주소를 INCHON1_SAMPLE_BASE_URL 로 지정한다.
+SAMPLE_URL = os.environ.get("INCHON1_SAMPLE_BASE_URL", f"{STATIC_URL}/samples").rstrip("/")
+INDEX_NAME = "_index.json"
+
+THUMB_WIDTH = 500          # 카드의 <img width="500"> 에 맞춤
+FETCH_TIMEOUT = 15
+NO_SAMPLE = "한도견본 없음"
+_SEP = re.compile(r"[,\s]+")   # 쉼표 또는 공백/줄바꿈 (URL은 퍼센트 인코딩이라 공백이 없음)
+
+SampleImage = namedtuple("SampleImage", "thumb full")
+Fetched = namedtuple("Fetched", "status data etag")
+
+_lock = threading.Lock()
+_write_lock = threading.Lock()
+_index_memo = {"sig": None, "index": {}}
+
+
+# ============================
+# 원격 가져오기
+# ============================
+def fetch_url(url: str, etag: str = None, timeout: float = FETCH_TIMEOUT) -> Fetched:
+    """GET (etag를 주면 If-None-Match) → Fetched(200|304, 바이트, ETag)"""
+    req = urllib.request.Request(url, headers={"User-Agent": "inchon1-sample-cache"})
+    if etag:
+        req.add_header("If-None-Match", etag)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return Fetched(resp.status, resp.read(), resp.headers.get("ETag"))
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return Fetched(304, b"", etag)
+        raise
+
+
+def rebase(url: str, upstream: str) -> str:
+    """원격 URL의 scheme/host만 upstream 으로 바꿈 (로컬 대역 서버로 받기)"""
+    if not upstream:
+        return url
+    parts = urllib.parse.urlsplit(url)
+    base = urllib.parse.urlsplit(upstream)
+    return urllib.parse.urlunsplit((base.scheme, base.netloc, parts.path, parts.query, ""))
+
+
+def sample_urls(text) -> list:
+    """한도견본 칸 → 이미지 URL 목록 (쉼표/공백 구분, '한도견본 없음' 제외) — 카드도 같은 규칙"""
+    text = str(text if text is not None else "").strip()
+    if text in ("", "nan", NO_SAMPLE):
+        return []
+    return [u for u in _SEP.split(text) if u]
+
+
+# ============================
+# 캐시 색인 (static/samples/_index.json: URL → 파일 이름/ETag)
+# ============================
+def _index_path(sample_dir: str) -> str:
+    return os.path.join(sample_dir, INDEX_NAME)
+
+
+def load_index(sample_dir: str = SAMPLE_DIR) -> dict:
+    """색인 파일의 (mtime, size)가 바뀔 때만 다시 읽음"""
+    path = _index_path(sample_dir)
+    try:
+        st_ = os.stat(path)
+        sig = (path, st_.st_mtime_ns, st_.st_size)
+    except OSError:
+        return {}
+    with _lock:
+        if _index_memo["sig"] == sig:
+            return _index_memo["index"]
+    try:
+        with open(path, encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        index = {}
+    with _lock:
+        _index_memo.update(sig=sig, index=index)
+    return index
+
+
+def index_revision(sample_dir: str = SAMPLE_DIR):
+    """카드 HTML 캐시 키용 — 색인이 바뀌면 (새로 받은 이미지가 있으면) 달라짐"""
+    try:
+        st_ = os.stat(_index_path(sample_dir))
+    except OSError:
+        return None
+    return (st_.st_mtime_ns, st_.st_size)
+
+
+def _atomic_write(path: str, data: bytes):
+    tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _save_index(index: dict, sample_dir: str):
+    os.makedirs(sample_dir, exist_ok=True)
+    _atomic_write(_index_path(sample_dir), json.dumps(index, ensure_ascii=False, indent=1).encode("utf-8"))
+
+
+def lookup(url: str, sample_dir: str = SAMPLE_DIR, base_url: str = SAMPLE_URL):
+    """캐시된 이미지면 SampleImage(썸네일 URL, 원본 URL), 아니면 None (네트워크 사용 안 함)"""
+    entry = load_index(sample_dir).get(url)
+    if not entry:
+        return None
+    return SampleImage(f"{base_url}/{entry['thumb']}", f"{base_url}/{entry['full']}")
+
+
+def display_urls(url: str) -> SampleImage:
+    """카드용 (썸네일, 원본) — 캐시에 없으면 원격 URL 그대로"""
+    return lookup(url) or SampleImage(url, url)
+
+
+# ============================
+# 다운로드 + 썸네일
+# ============================
+def _thumbnail(data: bytes, width: int = THUMB_WIDTH):
+    """(바이트, 확장자) — Pillow가 없거나 읽지 못하면 원본 그대로"""
+    try:
+        from PIL import Image
+
+        with Image.open(io.BytesIO(data)) as im:
+            if im.width > width:
+                im = im.resize((width, round(im.height * width / im.width)), Image.LANCZOS)
+            buf = io.BytesIO()
+            im.save(buf, format="WEBP", quality=80)
+            return buf.getvalue(), "webp"
+    except (ImportError, OSError, ValueError):
+        return data, None
+
+
+def _full_ext(url: str) -> str:
+    ext = os.path.splitext(urllib.parse.urlsplit(url).path)[1].lower().lstrip(".")
+    return ext if ext in ("jpg", "jpeg", "png", "gif", "webp") else "bin"
+
+
+def cache_image(url: str, fetch=fetch_url, upstream: str = None, refresh: bool = False,
+                sample_dir: str = SAMPLE_DIR) -> str:
+    """
+    URL 하나를 캐시에 넣음 → 'cached'(이미 있음) / 'fresh'(304) / 'downloaded'.
+    원본 파일 이름 = 내용 sha256 앞 16자, 썸네일 = 같은 이름 + '-t{THUMB_WIDTH}.webp'.
+    """
+    index = load_index(sample_dir)
+    entry = index.get(url)
+    if entry and not refresh and os.path.exists(os.path.join(sample_dir, entry["full"])):
+        return "cached"
+
+    got = fetch(rebase(url, upstream), etag=entry.get("etag") if entry else None)
+    if got.status == 304 and entry:
+        return "fresh"
+
+    digest = hashlib.sha256(got.data).hexdigest()[:16]
+    full = f"{digest}.{_full_ext(url)}"
+    thumb_data, thumb_ext = _thumbnail(got.data)
+    thumb = f"{digest}-t{THUMB_WIDTH}.{thumb_ext}" if thumb_ext else full
+    os.makedirs(sample_dir, exist_ok=True)
+    for name, data in ((full, got.data), (thumb, thumb_data)):
+        path = os.path.join(sample_dir, name)
+        if not os.path.exists(path):
+            _atomic_write(path, data)
+
+    with _write_lock:
+        # 여러 스레드가 동시에 받아도 색인은 최신 파일 기준으로 합쳐서 저장
+        index = dict(load_index(sample_dir))
+        index[url] = {"full": full, "thumb": thumb, "etag": got.etag,
+                      "bytes": len(got.data), "fetched": time.strftime("%Y-%m-%d %H:%M:%S")}
+        _save_index(index, sample_dir)
+    return "downloaded"
+
+
+def prefetch(urls, fetch=fetch_url, upstream: str = None, refresh: bool = False,
+             workers: int = 4, sample_dir: str = SAMPLE_DIR) -> dict:
+    """URL 목록 전체 캐시 → {'downloaded': n, 'cached': n, 'fresh': n, 'failed': [(url, 오류)]}"""
+    urls = list(dict.fromkeys(urls))
+    result = {"downloaded": 0, "cached": 0, "fresh": 0, "failed": []}
+
+    def _one(url):
+        try:
+            return url, cache_image(url, fetch, upstream, refresh, sample_dir), None
+        except (OSError, ValueError, http.client.HTTPException) as e:   # URLError/HTTPError/timeout 포함
+            return url, None, e
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for url, status, err in pool.map(_one, urls):
+            if err is not None:
+                result["failed"].append((url, str(err)))
+            else:
+                result[status] += 1
+    return result
+
+
+def catalogue_urls(csv_path: str) -> list:
+    """product_data.csv 의 한도견본 열 → 중복 없는 URL 목록"""
+    import pandas as pd
+
+    df = pd.read_csv(csv_path, encoding="utf-8", usecols=["한도견본"])
+    urls = (u for text in df["한도견본"] for u in sample_urls(text))
+    return list(dict.fromkeys(u for u in urls if u.startswith(("http://", "https://"))))
+
+
+# ============================
+# 로컬 HTTP 서버 (ETag + immutable) — 원격 저장소 대역/사내 이미지 프록시
+# ============================
+_etag_memo = {}
+
+
+class CachingHandler(SimpleHTTPRequestHandler):
+    """정적 파일 + 강한 ETag(내용 해시) + If-None-Match 304 + 1년 immutable 캐시"""
+
+    def send_head(self):
+        path = self.translate_path(self.path)
+        if os.path.isdir(path) or not os.path.exists(path):
+            return super().send_head()
+        st_ = os.stat(path)
+        key = (path, st_.st_mtime_ns, st_.st_size)
+        etag = _etag_memo.get(key)
+        if etag is None:
+            with open(path, "rb") as f:
+                etag = _etag_memo[key] = '"' + hashlib.sha1(f.read()).hexdigest() + '"'
+        if etag in [t.strip() for t in self.headers.get("If-None-Match", "").split(",")]:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return None
+        f = open(path, "rb")
+        self.send_response(200)
+        self.send_header("Content-Type", mimetypes.guess_type(path)[0] or "application/octet-stream")
+        self.send_header("Content-Length", str(os.fstat(f.fileno()).st_size))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "public, max-age=31536000, immutable")
+        self.end_headers()
+        return f
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(directory: str, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """directory 를 서빙하는 서버 (호출한 쪽에서 serve_forever / shutdown)"""
+    handler = lambda *a, **kw: CachingHandler(*a, directory=directory, **kw)  # noqa: E731
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="한도견본 이미지 캐시")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    pf = sub.add_parser("prefetch", help="product_data.csv 의 한도견본을 미리 받아 썸네일 생성")
+    pf.add_argument("--csv", default="product_data.csv")
+    pf.add_argument("--upstream", help="원격 대신 받을 서버 (예: http://127.0.0.1:8765)")
+    pf.add_argument("--refresh", action="store_true", help="이미 받은 이미지도 ETag로 다시 확인")
+    pf.add_argument("--workers", type=int, default=4)
+    sv = sub.add_parser("serve", help="폴더를 ETag/immutable 헤더로 서빙 (원격 대역)")
+    sv.add_argument("--dir", required=True)
+    sv.add_argument("--port", type=int, default=8765)
+    sv.add_argument("--host", default="127.0.0.1")
+    args = ap.parse_args(argv)
+
+    if args.cmd == "serve":
+        httpd = serve(args.dir, args.port, args.host)
+        print(f"serving {os.path.abspath(args.dir)} on http://{args.host}:{args.port}")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    urls = catalogue_urls(args.csv)
+    result = prefetch(urls, upstream=args.upstream, refresh=args.refresh, workers=args.workers)
+    print(f"이미지 {len(urls)}개: 새로 받음 {result['downloaded']}, 이미 있음 {result['cached']}, "
+          f"변경 없음 {result['fresh']}, 실패 {len(result['failed'])}")
+    for url, err in result["failed"]:
+        print(f"  ❌ {url}: {err}", file=sys.stderr)
+    return 1 if result["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+from whitepaper import parse_spec_text
+
+# ============================
+# 규격(사내규격 COA / 법적규격) → 수치형 long-format 표
+# ============================
+# "1. 수분(%) : 10 이하" 한 줄 = 한 행 (제품코드, 구분, 항목, 단위, 조건, 하한, 상한, 비고, 원문).
+# 카탈로그 버전당 한 번 파싱해 두고, "수분 ≤ 10 이고 DE ≥ 96" 같은 질의는 항목별 구간(slice)에 대한
+# 벡터 비교로 처리한다. 같은 표로 여러 제품의 규격을 나란히 비교한다.
+SPEC_SOURCES = {"사내규격(COA)": "사내", "법적규격": "법적"}
+SPEC_COLUMNS = ["제품코드", "구분", "항목", "단위", "조건", "하한", "상한", "비고", "원문"]
+
+OP_MAX = "이하"        # 상한만 (미만 포함)
+OP_MIN = "이상"        # 하한만 (초과 포함)
+OP_RANGE = "범위"      # 하한~상한
+OP_NOT_DETECTED = "불검출"
+OP_TEXT = "기타"       # 적합/확인 필요 등 수치가 없는 규격
+OPS = [OP_MAX, OP_MIN, OP_RANGE, OP_NOT_DETECTED, OP_TEXT]
+
+# 같은 항목의 표기 차이 → (항목, 단위)
+ITEM_ALIASES = {
+    "포도당당량 DE(%)": ("DE", "%"),
+    "포도당당량(DE,%)": ("DE", "%"),
+    "포도당당량(DE)": ("DE", ""),
+    "포도당당량(D.E)": ("DE", ""),
+}
+
+_NUM = r"(\d+(?:\.\d+)?)"
+_RANGE = re.compile(rf"^\s*{_NUM}\s*~\s*{_NUM}")
+_BOUND = re.compile(rf"{_NUM}\s*(?:%|mg/kg)?\s*(이하|미만|이상|초과)")
+_NOT_DETECTED = re.compile(r"불검출|검출되어서는\s*아니|음성")
+_ITEM_UNIT = re.compile(r"^(.*?)\s*\(([^()]*)\)$")
+_NOTE = re.compile(r"\(([^()]*)\)")
+
+
+def split_item(key: str):
+    """'수분(%)' → ('수분', '%'), 'pH(10%)' → ('pH', '10%'), '이물' → ('이물', '')"""
+    key = key.strip()
+    if key in ITEM_ALIASES:
+        return ITEM_ALIASES[key]
+    m = _ITEM_UNIT.match(key)
+    if m and m.group(1):
+        return m.group(1).strip(), m.group(2).strip()
+    return key, ""
+
+
+def parse_bound(text: str):
+    """
+    규격 값 → (조건, 하한, 상한, 비고).
+    '10 이하' → (이하, nan, 10), '4.5~7.0' → (범위, 4.5, 7.0), '68 이상 70 미만' → (범위, 68, 70).
+    값이 여러 개('1) 57.0이상(...), 2) 50.0이상(...)')면 쪽마다 첫 번째만 쓴다.
+    """
+    text = str(text).strip()
+    note = ", ".join(n.strip() for n in _NOTE.findall(text) if n.strip())
+    if _NOT_DETECTED.search(text):
+        return OP_NOT_DETECTED, np.nan, np.nan, note
+    m = _RANGE.match(text)
+    if m:
+        return OP_RANGE, float(m.group(1)), float(m.group(2)), note
+    lo = hi = np.nan
+    for num, op in _BOUND.findall(text):
+        if op in ("이상", "초과") and np.isnan(lo):
+            lo = float(num)
+        elif op in ("이하", "미만") and np.isnan(hi):
+            hi = float(num)
+    if not np.isnan(lo) and not np.isnan(hi):
+        return OP_RANGE, lo, hi, note
+    if not np.isnan(lo):
+        return OP_MIN, lo, hi, note
+    if not np.isnan(hi):
+        return OP_MAX, lo, hi, note
+    return OP_TEXT, lo, hi, note
+
+
+def parse_catalogue(df: pd.DataFrame) -> pd.DataFrame:
+    """제품 프레임 전체 → 규격 long-format 프레임 (SPEC_COLUMNS)"""
+    rows = []
+    codes = df["제품코드"].astype(str).str.strip() if "제품코드" in df.columns else pd.Series([], dtype=str)
+    for column, source in SPEC_SOURCES.items():
+        if column not in df.columns:
+            continue
+        for code, text in zip(codes, df[column]):
+            for key, value in parse_spec_text(text).items():
+                item, unit = split_item(key)
+                op, lo, hi, note = parse_bound(value)
+                rows.append((code, source, item, unit, op, lo, hi, note, value))
+    frame = pd.DataFrame(rows, columns=SPEC_COLUMNS)
+    frame["하한"] = frame["하한"].astype("float64")
+    frame["상한"] = frame["상한"].astype("float64")
+    return frame
+
+
+class SpecTable:
+    """
+    규격 long-format 표 + 항목 색인. 항목 기준으로 정렬해 두고 항목 → 행 구간(slice)을 들고 있어
+    한 항목의 전 제품 규격을 O(1)로 잘라 벡터 비교한다.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        frame = frame.sort_values(["항목", "제품코드", "구분"], kind="stable").reset_index(drop=True)
+        for col in ("구분", "항목", "단위", "조건"):
+            frame[col] = frame[col].astype("category")
+        self.frame = frame
+        items = frame["항목"].astype(str).to_numpy()
+        self._slices = {}
+        if len(items):
+            starts = np.flatnonzero(np.r_[True, items[1:] != items[:-1]])
+            ends = np.r_[starts[1:], len(items)]
+            self._slices = {items[s]: slice(int(s), int(e)) for s, e in zip(starts, ends)}
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame):
+        return cls(parse_catalogue(df) if not df.empty else pd.DataFrame(columns=SPEC_COLUMNS))
+
+    def items(self, numeric_only: bool = False) -> list:
+        """항목 목록 (사용 제품 수가 많은 순). numeric_only면 수치 비교가 가능한 항목만"""
+        frame = self.frame
+        if numeric_only:
+            frame = frame[frame["하한"].notna() | frame["상한"].notna()]
+        counts = frame.groupby("항목", observed=True)["제품코드"].nunique()
+        return counts.sort_values(ascending=False, kind="stable").index.astype(str).tolist()
+
+    def rows(self, item: str) -> pd.DataFrame:
+        return self.frame.iloc[self._slices.get(item, slice(0, 0))]
+
+    def bounds(self, item: str):
+        """항목의 (최소 하한/상한, 최대 하한/상한) — 슬라이더 범위용. 수치가 없으면 None"""
+        rows = self.rows(item)
+        values = pd.concat([rows["하한"], rows["상한"]]).dropna()
+        if values.empty:
+            return None
+        return float(values.min()), float(values.max())
+
+    def match(self, item: str, op: str, value=None, source=None) -> pd.Index:
+        """
+        조건을 만족하는 제품코드. 규격이 조건을 보장하는지 기준:
+          이하 v → 상한 ≤ v,  이상 v → 하한 ≥ v,  범위 (a, b) → a ≤ 하한 and 상한 ≤ b,  불검출 → 불검출 규격
+        source('사내'/'법적')를 주면 그 규격만, 아니면 어느 쪽이든 만족하면 포함.
+        """
+        rows = self.rows(item)
+        if source:
+            rows = rows[rows["구분"] == source]
+        if op == OP_MAX:
+            mask = rows["상한"].to_numpy() <= value
+        elif op == OP_MIN:
+            mask = rows["하한"].to_numpy() >= value
+        elif op == OP_RANGE:
+            lo, hi = value
+            mask = (rows["하한"].to_numpy() >= lo) & (rows["상한"].to_numpy() <= hi)
+        elif op == OP_NOT_DETECTED:
+            mask = (rows["조건"] == OP_NOT_DETECTED).to_numpy()
+        else:
+            raise ValueError(f"지원하지 않는 조건: {op}")
+        return pd.Index(rows["제품코드"].to_numpy()[mask]).unique()
+
+    def query(self, conditions, source=None) -> pd.Index:
+        """[(항목, 조건, 값), ...] 모두 만족하는 제품코드 (조건이 없으면 규격이 있는 전체)"""
+        result = None
+        for item, op, value in conditions:
+            codes = self.match(item, op, value, source)
+            result = codes if result is None else result.intersection(codes)
+            if result.empty:
+                break
+        if result is None:
+            return pd.Index(self.frame["제품코드"].unique())
+        return result
+
+    def compare(self, codes) -> pd.DataFrame:
+        """
+        제품 규격 나란히 비교 — index (항목, 구분), columns 제품코드(주어진 순서), 값 '원문'.
+        해당 항목 규격이 없는 제품은 '-'.
+        """
+        codes = [str(c).strip() for c in codes]
+        sub = self.frame[self.frame["제품코드"].isin(codes)]
+        if sub.empty:
+            return pd.DataFrame(columns=codes)
+        wide = (sub.pivot_table(index=["항목", "구분"], columns="제품코드", values="원문",
+                                aggfunc="first", observed=True)
+                .reindex(columns=codes)
+                .fillna("-"))
+        wide.columns.name = None
+        return wide
+
+    def matrix(self, codes, items, prefer: str = "사내") -> pd.DataFrame:
+        """
+        제품 × 항목 표 (index 제품코드, columns 항목, 값 '원문'). 한 항목에 사내/법적이 모두 있으면 prefer 쪽.
+        주어진 제품코드 행만 잘라 쓰므로 비용은 표시할 제품 수에 비례.
+        """
+        codes = [str(c).strip() for c in codes]
+        parts = [rows[rows["제품코드"].isin(codes)] for rows in (self.rows(item) for item in items)]
+        parts = [p for p in parts if not p.empty]
+        if not parts:
+            return pd.DataFrame(index=pd.Index(codes, name="제품코드"), columns=list(items)).fillna("-")
+        sub = pd.concat(parts)
+        sub = sub.assign(_rank=(sub["구분"] != prefer).astype(int)).sort_values("_rank", kind="stable")
+        wide = (sub.drop_duplicates(["제품코드", "항목"])
+                .pivot(index="제품코드", columns="항목", values="원문"))
+        wide.columns = wide.columns.astype(str)
+        return wide.reindex(index=codes, columns=list(items)).fillna("-").rename_axis("제품코드")
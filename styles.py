@@ -0,0 +1,398 @@
+import re
+
+# ============================
+# 페이지별 CSS 레지스트리
+# ============================
+# 스타일 블록은 여기서 한 번만 선언하고, 페이지마다 쓰는 블록 목록(PAGE_STYLES)을
+# import 시점에 하나의 압축된 <style> 시트로 묶어 둔다(PAGE_SHEETS).
+# 앱은 rerun마다 여러 개의 긴 st.markdown <style> 대신 페이지 시트 하나만 같은 위치에 내보낸다.
+STYLES = {}
+
+# 배경 (이미지 URL은 런타임에 background_rule로 붙임)
+STYLES["background"] = """
+    [data-testid="stAppViewContainer"] {
+        background-size: cover;
+        background-position: center;
+        background-repeat: no-repeat;
+    }
+    main .block-container {
+        background: transparent;
+    }
+    [data-testid="stSidebar"] {
+        background: rgba(0, 0, 0, 0.55);
+        color: #ffffff;
+    }
+    body, [data-testid="stMarkdownContainer"], .stMarkdown p {
+        color: #f5f5f5;
+    }
+"""
+
+# 사이드바 접기/펼치기 화살표 — 모든 페이지 공통, 시트 맨 끝에 두어 최종 덮어쓰기
+STYLES["sidebar_arrow"] = """
+    /* ===========================
+       1) 사이드바가 펼쳐져 있을 때
+       왼쪽 안쪽의 접기 버튼 (←)
+       =========================== */
+    [data-testid="stSidebarCollapseButton"] span,
+    [data-testid="stSidebarCollapseButton"] span * {
+        color: #ffffff !important;
+        fill: #ffffff !important;
+        stroke: #ffffff !important;
+    }
+
+    /* 버튼 배경 / 테두리 제거 (투명) */
+    [data-testid="stSidebarCollapseButton"] > button {
+        background: transparent !important;
+        border: none !important;
+        box-shadow: none !important;
+    }
+
+    /* ===========================
+       2) 사이드바가 완전히 접혔을 때
+       화면 왼쪽 위에 떠 있는 펼치기 버튼 (→)
+       (방금 캡처에서 본 test-id: stExpandSidebarButton)
+       =========================== */
+    [data-testid="stExpandSidebarButton"] span,
+    [data-testid="stExpandSidebarButton"] span * {
+        color: #ffffff !important;
+        fill: #ffffff !important;
+        stroke: #ffffff !important;
+    }
+
+    [data-testid="stExpandSidebarButton"] > button {
+        background-color: rgba(0, 0, 0, 0.6) !important;
+        border-radius: 999px !important;
+        border: 1px solid #ffffff80 !important;
+    }
+    [data-testid="stExpandSidebarButton"] > button:hover {
+        background-color: rgba(255, 255, 255, 0.15) !important;
+    }
+"""
+
+# 상단 흰 헤더 투명 처리 + 헤더 아래 여백 제거 (Home / 제품백서 / 공정 일일 작업기록 공통)
+STYLES["header_transparent"] = """
+    /* 상단 기본 헤더 투명 처리 */
+    header[data-testid="stHeader"] {
+        display: block !important;
+        background: transparent !important;
+        box-shadow: none !important;
+    }
+    /* 헤더 아래 쓸데없는 위쪽 여백 제거 */
+    header[data-testid="stHeader"] + div {
+        padding-top: 0 !important;
+    }
+"""
+
+# 인트로 화면
+STYLES["intro"] = """
+    /* 헤더/사이드바 숨김 */
+    [data-testid="stSidebar"] {display: none;}
+    header[data-testid="stHeader"] {display: none;}
+
+    /* 배경색 통일 */
+    html, body, [data-testid="stAppViewContainer"] {
+        background-color: #001b3a;
+    }
+
+    /* 컨테이너 조정 */
+    .block-container {
+        padding-top: 0rem;
+        max-width: 1000px;
+    }
+
+    /* 🔹 인트로 이미지 크기 & 정렬 */
+    .intro-wrap img {
+        width: 1000%;             /* 기존 120% → 135% 로 확대 */
+        max-width: 1000px;       /* 최대치도 같이 키움 */
+        margin-left: auto;
+        margin-right: auto;
+        display: block;
+        margin-top: 350px;  
+    }
+
+    /* 🔹 텍스트/버튼 영역: 이미지 바로 아래에 위치하게 */
+    .intro-section {
+        margin-top: -200px;        
+    }
+
+    /* ✅ 버튼 글씨 강제 색상 지정 */
+    .stButton > button {
+        background-color: #ffffff !important;
+        color: #111 !important;
+        border-radius: 999px;
+        padding: 0.8rem 1.5rem;
+        font-weight: 600;
+    }
+
+    /* ✅ 버튼 안에 들어가는 모든 텍스트도 같이 변경 */
+    .stButton > button * {
+        color: #111 !important;
+    }
+
+    .stButton > button:hover {
+        filter: brightness(0.95);
+    }
+
+    /* 상단 로봇 이미지 아래로 이동 (필요시 여백 조정) */
+    .hero-image {
+        margin-top: -200px;
+    }
+
+    .custom-hr {
+        width: 40%;
+        height: 2px;
+        background-color: #ffffff55;
+        margin: 40px auto;
+        border-radius: 3px;
+    }
+"""
+
+# AI 챗봇: 헤더/사이드바/메인 컨테이너 스크롤 전부 숨기기
+STYLES["chatbot"] = """
+    /* 상단 기본 헤더 숨기기 */
+    header[data-testid="stHeader"] {
+        display: none;
+    }
+
+    /* 메인 컨테이너 여백 제거 */
+    main .block-container {
+        padding: 0;
+        margin: 0;
+        max-width: 100%;
+    }
+
+    /* 전체 앱 컨테이너와 메인 영역, 사이드바 스크롤 숨기기 */
+    html, body,
+    [data-testid="stAppViewContainer"],
+    [data-testid="stMain"],
+    [data-testid="stSidebar"],
+    [data-testid="stVerticalBlock"] {
+        margin: 0;
+        height: 100%;
+        overflow: hidden !important;
+    }
+"""
+
+# 제품백서 페이지용 레이아웃/색상
+STYLES["product"] = """
+    /* 이 페이지 중앙 내용 영역을 흰색 카드처럼 */
+    main .block-container {
+        background-color: #ffffff !important;   /* 흰 배경 */
+        border-radius: 16px;
+        padding: 1.5rem 2rem 2.5rem 2rem !important;
+        margin-top: 1.5rem !important;
+        max-width: 100% !important;
+    }
+
+    /* 🔹 Expander 헤더를 흰색으로 */
+    div[data-testid="stExpander"] > details > summary {
+        background-color: #ffffff !important;
+        color: #000000 !important;
+        border-radius: 8px;
+    }
+
+    /* 🔹 Expander 제목 텍스트 검정색 */
+    div[data-testid="stExpander"] summary span,
+    div[data-testid="stExpander"] summary p,
+    div[data-testid="stExpander"] summary div {
+        color: #000000 !important;
+        font-weight: 600 !important;
+    }
+
+
+    /* 안쪽 텍스트 색상 */
+    main .block-container h1,
+    main .block-container h2,
+    main .block-container h3,
+    main .block-container h4,
+    main .block-container p,
+    main .block-container label,
+    main .block-container span {
+        color: #000000 !important;
+    }
+
+    /* 입력창/텍스트 영역 */
+    main .block-container input,
+    main .block-container textarea,
+    main .block-container select {
+        background-color: #ffffff !important;
+        color: #000000 !important;
+    }
+"""
+
+# 공정 일일 작업기록: '제품코드 선택 (201/...)' 제목 한 줄 고정 + 숫자만 작게
+STYLES["ops_title"] = """
+    /* ✅ '제품코드 선택 (201/...)' 제목 한 줄 고정 + 숫자만 작게 */
+    .ops-title {
+      display: flex;
+      align-items: baseline;
+      gap: 8px;
+      flex-wrap: nowrap;          /* 줄바꿈 방지 */
+    }
+    .ops-title .nums {
+    font-size: 0.75em;          /* 숫자 부분만 축소 */
+    white-space: nowrap;        /* 숫자 부분 절대 줄바꿈 금지 */
+    opacity: 0.95;
+    }
+"""
+
+# 공정 일일 작업기록: 파쇄RPM(text_area) 높이를 number_input 수준으로 고정
+STYLES["ops_inputs"] = """
+    /* page_ops_log 화면에서 나오는 모든 textarea 높이 고정(원하면 전분공정만 더 좁힐 수도 있음) */
+    div[data-testid="stTextArea"] textarea {
+        height: 48px !important;
+        min-height: 48px !important;
+        max-height: 48px !important;
+        resize: none !important;
+        padding-top: 8px !important;
+        padding-bottom: 8px !important;
+    }
+
+    /* number_input 입력창 높이도 동일하게 맞춤(선택이지만 추천) */
+    div[data-testid="stNumberInput"] input,
+    div[data-testid="stTextInput"] input {
+        height: 48px !important;
+        padding-top: 8px !important;
+        padding-bottom: 8px !important;
+    }
+"""
+
+# 공정 일일 작업기록: 저장 버튼 글씨를 확실히 검정색으로
+STYLES["ops_submit"] = """
+    /* 공정 일일 작업기록 화면의 폼 제출 버튼(target: stFormSubmitButton) */
+    [data-testid="stFormSubmitButton"] > button {
+        color: #000000 !important;          /* 버튼 텍스트 */
+        font-weight: 600 !important;
+        background-color: #ffffff !important;  /* 필요하면 배경도 하얀색 */
+    }
+    /* 버튼 안쪽 아이콘/텍스트까지 모두 검정으로 */
+    [data-testid="stFormSubmitButton"] > button * {
+        color: #000000 !important;
+    }
+"""
+
+# 홈: 레이아웃 & 버튼 스타일 + 홈 카드 스타일
+STYLES["home"] = """
+    html, body,
+    [data-testid="stAppViewContainer"],
+    [data-testid="stMain"],
+    [data-testid="stSidebar"],
+    [data-testid="stVerticalBlock"] {
+        overflow: auto !important;
+        height: auto !important;
+    }
+
+    /* 메인 컨테이너 기본 패딩 */
+    main .block-container {
+        padding: 1rem 2rem 2rem 2rem !important;
+        margin: auto !important;
+        max-width: 100% !important;
+    }
+
+    /* 기본 버튼: 흰 배경 + 진한 글씨 */
+    .stButton > button {
+        background-color: #ffffff !important;
+        color: #111111 !important;
+        font-weight: 600 !important;
+        border-radius: 999px !important;
+    }
+    .stButton > button * {
+        color: #111111 !important;
+    }
+
+    /* 위쪽 질문하기 가짜 입력창 버튼 */
+    .fake-input-btn .stButton > button {
+        width: 100% !important;
+        border-radius: 10px !important;
+        border: 1px solid #ff4b4b !important;
+        background: #f5f6fa !important;
+        text-align: left !important;
+        padding: 12px 16px !important;
+        font-size: 14px !important;
+        height: 46px !important;
+    }
+    .fake-input-btn .stButton > button,
+    .fake-input-btn .stButton > button * {
+        color: #555555 !important;
+    }
+    .fake-input-btn .stButton > button:hover {
+        background: #eceff4 !important;
+    }
+
+    /* ---------- 홈 카드 컨테이너(= st.container) 전용 스타일 ---------- */
+    /* 안에 .home-card-marker 가 들어있는 st.container만 잡아서 스타일 적용 */
+    [data-testid="stContainer"]:has(.home-card-marker) {
+        border: 3px solid #ffffff !important;            /* 흰색 테두리 */
+        border-radius: 18px !important;                  /* 모서리 둥글게 */
+        padding: 20px 18px 16px 18px !important;         /* 안쪽 여백 */
+        background: rgba(0, 0, 0, 0.75) !important;      /* 카드 배경 */
+        box-shadow: 0 0 14px rgba(255, 255, 255, 0.25) !important;  /* 은은한 빛 */
+        margin-bottom: 20px !important;                  /* 아래 간격 */
+    }
+
+    /* 카드 안 텍스트 색상 */
+    [data-testid="stContainer"]:has(.home-card-marker) h4,
+    [data-testid="stContainer"]:has(.home-card-marker) p {
+        color: #ffffff !important;
+    }
+
+    /* 마커 자체는 화면에 보이지 않게 숨김 */
+    .home-card-marker {
+        display: none;
+    }
+"""
+
+# 홈: 질문하기 창(클릭 → 챗봇 이동)
+STYLES["home_fake_input"] = """
+    .fake-input-btn button {
+        width: 100% !important;
+        border-radius: 10px !important;
+        border: 1px solid #ff4b4b !important;
+        background: #f5f6fa !important;
+        color: #888 !important;
+        text-align: left !important;
+        padding: 12px 16px !important;
+        font-size: 14px !important;
+        height: 46px !important;
+    }
+    .fake-input-btn button:hover {
+        background: #eceff4 !important;
+    }
+"""
+
+# 페이지 → 블록 순서 (뒤에 오는 블록이 앞의 규칙을 덮어씀)
+PAGE_STYLES = {
+    "intro": ["background", "intro"],
+    "Home": ["background", "header_transparent", "home", "home_fake_input", "sidebar_arrow"],
+    "인천 1공장 AI 챗봇": ["background", "chatbot", "sidebar_arrow"],
+    "제품백서": ["background", "header_transparent", "product", "sidebar_arrow"],
+    "공정 일일 작업기록": ["background", "header_transparent", "ops_title", "ops_inputs", "ops_submit", "sidebar_arrow"],
+    "공정 트렌드": ["background", "header_transparent", "sidebar_arrow"],
+}
+DEFAULT_STYLES = ["background", "sidebar_arrow"]
+
+
+def minify_css(css: str) -> str:
+    """주석 제거 + 공백 정리 (선택자 안의 자손 결합자 공백은 한 칸으로 유지)"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+def compile_sheet(names) -> str:
+    return "".join(minify_css(STYLES[n]) for n in names)
+
+
+PAGE_SHEETS = {page: compile_sheet(names) for page, names in PAGE_STYLES.items()}
+_DEFAULT_SHEET = compile_sheet(DEFAULT_STYLES)
+
+
+def background_rule(url: str) -> str:
+    return f'[data-testid="stAppViewContainer"]{{background-image:url("{url}")}}'
+
+
+def page_sheet(page: str, extra: str = "") -> str:
+    """페이지 시트 <style> 태그 — extra는 배경 URL처럼 런타임에 정해지는 규칙"""
+    return f"<style>{extra}{PAGE_SHEETS.get(page, _DEFAULT_SHEET)}</style>"
@@ -0,0 +1,127 @@
+import hashlib
+import mimetypes
+import os
+import threading
+import uuid
+import zipfile
+
+import pandas as pd
+
+# ============================
+# data/uploads 인증서 파일 색인
+# ============================
+# 파일명 규칙: {제품코드}_{인증서키}.{확장자}  (예: GIS7030_HACCP.pdf)
+UPLOAD_DIR = os.path.join("data", "uploads")
+BUNDLE_DIR = os.path.join("data", ".cache", "bundles")
+
+CERT_NAME_MAP = {
+    "HACCP 인증서": "HACCP", "ISO9001 인증서": "ISO9001",
+    "제품규격": "SPEC", "FSSC22000": "FSSC22000",
+    "할랄인증서": "HALAL", "원산지규격서": "COO", "MSDS": "MSDS",
+    "기타": "ETC"
+}
+# 같은 이름이 여러 확장자로 있으면 앞쪽 우선
+CERT_EXTENSIONS = ["pdf", "docx", "xlsx", "pptx", "jpg", "png"]
+_EXT_RANK = {ext: i for i, ext in enumerate(CERT_EXTENSIONS)}
+
+_lock = threading.Lock()
+_memo = {}
+
+
+def cert_key(cert_label: str) -> str:
+    return CERT_NAME_MAP.get(cert_label, cert_label)
+
+
+class UploadIndex:
+    """os.scandir 한 번으로 만든 {파일 stem: 최우선 확장자 파일 경로} 사전"""
+
+    def __init__(self, upload_dir: str = UPLOAD_DIR):
+        self.upload_dir = upload_dir
+        best = {}
+        try:
+            entries = list(os.scandir(upload_dir))
+        except FileNotFoundError:
+            entries = []
+        for entry in entries:
+            stem, dot, ext = entry.name.rpartition(".")
+            rank = _EXT_RANK.get(ext)
+            if not dot or rank is None or not entry.is_file():
+                continue
+            if stem not in best or rank < best[stem][0]:
+                best[stem] = (rank, entry.name)
+        self.by_stem = {stem: name for stem, (_, name) in best.items()}
+
+    def find(self, code: str, cert: str):
+        """(제품코드, 인증서키) → (파일 경로, 파일명) 또는 None"""
+        name = self.by_stem.get(f"{code}_{cert}")
+        return None if name is None else (os.path.join(self.upload_dir, name), name)
+
+    def missing_report(self, codes, cert_labels) -> pd.DataFrame:
+        """제품코드 × 인증서 종류별 보유 여부 표 (행: 제품코드, 열: 인증서 라벨, 값: bool)"""
+        codes = [str(c).strip() for c in codes if str(c).strip()]
+        return pd.DataFrame(
+            {label: [f"{code}_{cert_key(label)}" in self.by_stem for code in codes]
+             for label in cert_labels},
+            index=pd.Index(codes, name="제품코드"),
+        )
+
+
+def get_upload_index(upload_dir: str = UPLOAD_DIR) -> UploadIndex:
+    """디렉터리 mtime이 바뀐 경우(파일 추가/삭제/이름변경)에만 다시 스캔"""
+    try:
+        mtime = os.stat(upload_dir).st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+    with _lock:
+        memo = _memo.get(upload_dir)
+        if memo and memo[0] == mtime:
+            return memo[1]
+    index = UploadIndex(upload_dir)
+    with _lock:
+        _memo[upload_dir] = (mtime, index)
+    return index
+
+
+# ============================
+# 지연 다운로드 (클릭 시점에만 파일을 읽음)
+# ============================
+def guess_mime(file_name: str) -> str:
+    return mimetypes.guess_type(file_name)[0] or "application/octet-stream"
+
+
+def file_loader(path: str):
+    """st.download_button(data=...)에 넘길 콜러블 — 렌더링 때는 파일을 열지 않는다"""
+    def _load():
+        with open(path, "rb") as f:
+            return f.read()
+    return _load
+
+
+def bundle_loader(files, bundle_dir: str = BUNDLE_DIR):
+    """
+    [(경로, zip 안 파일명), ...] → 클릭 시 zip 묶음을 돌려주는 콜러블.
+    zip은 (파일명, 크기, mtime) 해시 이름으로 디스크에 한 번만 만들고(파일 단위 스트리밍 기록)
+    같은 구성의 요청은 그대로 재사용한다.
+    """
+    files = sorted(files, key=lambda f: f[1])
+
+    def _load():
+        h = hashlib.sha256()
+        for path, arcname in files:
+            st_ = os.stat(path)
+            h.update(f"{arcname}\x1f{st_.st_size}\x1f{st_.st_mtime_ns}\x1e".encode("utf-8"))
+        bundle_path = os.path.join(bundle_dir, f"{h.hexdigest()[:32]}.zip")
+        if not os.path.exists(bundle_path):
+            os.makedirs(bundle_dir, exist_ok=True)
+            tmp = f"{bundle_path}.{uuid.uuid4().hex}.tmp"
+            try:
+                with zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED) as zf:
+                    for path, arcname in files:
+                        zf.write(path, arcname)
+                os.replace(tmp, bundle_path)
+            finally:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+        with open(bundle_path, "rb") as f:
+            return f.read()
+    return _load
@@ -0,0 +1,81 @@
+import hashlib
+import json
+import os
+import uuid
+from collections import namedtuple
+from datetime import datetime
+
+# ============================
+# 첨부파일 저장소 (SHA-256 내용 주소 방식, 중복 제거)
+# ============================
+# data/uploads/blobs/ab/abcdef...  ← 같은 내용은 한 번만 저장
+# data/uploads/blobs/manifest.jsonl ← {sha256, name, size, at} 업로드 이력 (이름 → 해시)
+# 요청/VOC 기록의 files 칸에는 "sha256:파일명" 참조를 ';'로 이어 저장한다.
+BLOB_DIR = os.path.join("data", "uploads", "blobs")
+CHUNK_SIZE = 1 << 20   # 1 MiB씩 읽고 해시하면서 바로 디스크에 기록
+
+StoredFile = namedtuple("StoredFile", "sha256 name size path deduplicated")
+
+
+def blob_path(sha256: str, blob_dir: str = BLOB_DIR) -> str:
+    return os.path.join(blob_dir, sha256[:2], sha256)
+
+
+def make_ref(sha256: str, name: str) -> str:
+    return f"{sha256}:{name}"
+
+
+def parse_ref(ref: str):
+    """'sha256:파일명' → (sha256, 파일명). 예전 형식(경로 문자열)은 (None, 경로)"""
+    sha, sep, name = ref.partition(":")
+    if sep and len(sha) == 64 and all(c in "0123456789abcdef" for c in sha):
+        return sha, name
+    return None, ref
+
+
+def _append_manifest(blob_dir: str, rec: dict):
+    # 한 줄짜리 O_APPEND 쓰기 → 여러 세션이 동시에 추가해도 줄이 섞이지 않음
+    line = (json.dumps(rec, ensure_ascii=False) + "\n").encode("utf-8")
+    fd = os.open(os.path.join(blob_dir, "manifest.jsonl"), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+
+
+def store_upload(fileobj, name: str, blob_dir: str = BLOB_DIR) -> StoredFile:
+    """
+    업로드 파일을 CHUNK_SIZE 단위로 읽으며 해시와 임시 파일 기록을 동시에 수행.
+    이미 같은 해시가 있으면 임시 파일을 버리고 기존 blob을 참조한다.
+    """
+    os.makedirs(blob_dir, exist_ok=True)
+    if hasattr(fileobj, "seek"):
+        fileobj.seek(0)
+    h = hashlib.sha256()
+    size = 0
+    tmp = os.path.join(blob_dir, f".{uuid.uuid4().hex}.tmp")
+    try:
+        with open(tmp, "wb") as out:
+            for chunk in iter(lambda: fileobj.read(CHUNK_SIZE), b""):
+                h.update(chunk)
+                out.write(chunk)
+                size += len(chunk)
+        sha = h.hexdigest()
+        path = blob_path(sha, blob_dir)
+        deduplicated = os.path.exists(path)
+        if not deduplicated:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    _append_manifest(blob_dir, {
+        "sha256": sha, "name": name, "size": size,
+        "at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    })
+    return StoredFile(sha, name, size, path, deduplicated)
+
+
+def store_uploads(files, blob_dir: str = BLOB_DIR) -> str:
+    """st.file_uploader 결과 목록 → 기록용 'sha256:파일명;...' 문자열"""
+    return ";".join(make_ref(s.sha256, s.name) for s in (store_upload(f, f.name, blob_dir) for f in files or []))
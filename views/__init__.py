@@ -0,0 +1,28 @@
+import importlib
+
+# ============================
+# 페이지 모듈 레지스트리 — 선택된 페이지의 모듈만 import
+# ============================
+# 폴더 이름이 pages/ 이면 Streamlit이 멀티페이지 앱으로 자동 인식하므로 views/ 를 쓴다.
+# 페이지 모듈은 처음 열릴 때 한 번만 import되고(sys.modules), 이후 rerun에서는 함수 호출만 한다.
+# 무거운 의존성(pandas 가공, fpdf/pypdf, 작업기록 저장소 등)은 해당 페이지 모듈에서만 import.
+PAGES = {
+    "Home": ("views.home", "page_home"),
+    "인천 1공장 AI 챗봇": ("views.chatbot", "page_chatbot"),
+    "제품백서": ("views.product", "page_product"),
+    "공정 일일 작업기록": ("views.ops_log", "page_ops_log"),
+    "공정 트렌드": ("views.ops_trend", "page_ops_trend"),
+}
+
+# 메뉴에는 없지만 모듈로 남아 있는 페이지 (메뉴에 올리려면 PAGES로 옮기면 됨)
+UNLISTED_PAGES = {
+    "서류 요청": ("views.docs", "page_docs_request_user"),
+    "서류 승인": ("views.docs", "page_docs_admin"),
+    "VOC 기록": ("views.voc", "page_voc"),
+}
+
+
+def load_page(name: str):
+    """페이지 이름 → 렌더 함수 (모듈은 이때 처음 import)"""
+    module, func = PAGES.get(name) or UNLISTED_PAGES[name]
+    return getattr(importlib.import_module(module), func)
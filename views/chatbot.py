@@ -0,0 +1,24 @@
+import streamlit as st
+
+# ============================
+# 페이지: AI 챗봇(플레이스홀더)
+# ============================
+def page_chatbot():
+    # 1) 화면 전체를 덮는 iframe (이 화면만 보이게)
+    iframe_html = """
+    <iframe
+        src="https://samibot.samyang.com/chatbot/9e054af9-fdbe-4290-b914-7620c73a5e1d"
+        style="
+            position: fixed;
+            top: 0;
+            left: 0;
+            width: 100vw;
+            height: 80vh;
+            border: none;
+        "
+        allow="clipboard-write; microphone; camera">
+    </iframe>
+    """
+
+    # 컴포넌트 자체는 화면에 잡히게 최소 높이만 줌
+    st.components.v1.html(iframe_html, height=800, scrolling=False)
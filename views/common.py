@@ -0,0 +1,109 @@
+import os
+
+import pandas as pd
+import streamlit as st
+
+from fulltext_search import FullTextIndex
+from product_cache import catalogue_version, csv_signature, read_product_frame
+from product_options import EMPTY_OPTIONS, build_product_options
+from product_search import ProductSearchIndex
+from spec_table import SpecTable
+
+# ============================
+# 공용 유틸
+# ============================
+def ensure_dir(path: str):
+    os.makedirs(path, exist_ok=True)
+
+DATA_DIR = "data"
+UPLOAD_DIR = os.path.join(DATA_DIR, "uploads")
+ensure_dir(DATA_DIR)
+ensure_dir(UPLOAD_DIR)
+
+def _ensure_date_columns(df: pd.DataFrame):
+    """요청일(입력 시각)과 마감일을 날짜 컬럼으로 안전하게 추가"""
+    d = df.copy()
+    # 요청일: timestamp(문자열) → date
+    d["요청일"] = pd.to_datetime(d.get("timestamp", None), errors="coerce").dt.date
+    # 마감일: due(문자열) → date
+    d["마감일"] = pd.to_datetime(d.get("due", None), errors="coerce").dt.date
+    return d
+
+def _render_grouped_by_date(df: pd.DataFrame, group_key: str, columns_to_show: list):
+    """
+    날짜별로 접어서 표시. group_key는 '요청일' 또는 '마감일'
+    columns_to_show는 테이블로 보여줄 컬럼 목록
+    """
+    if df.empty:
+        st.info("표시할 데이터가 없습니다.")
+        return
+    if group_key not in df.columns:
+        st.warning(f"'{group_key}' 기준 열이 없어 그룹화할 수 없습니다.")
+        return
+
+    # NaT/NaN 제거 후 날짜 내림차순
+    tmp = df.dropna(subset=[group_key]).copy()
+    if tmp.empty:
+        st.info("유효한 날짜 데이터가 없습니다.")
+        return
+
+    # 최신 날짜가 위로 오게 정렬
+    days = sorted(tmp[group_key].unique(), reverse=True)
+    for day in days:
+        day_df = tmp[tmp[group_key] == day].copy()
+        with st.expander(f"📅 {day} — {len(day_df)}건", expanded=False):
+            st.dataframe(day_df[columns_to_show], use_container_width=True)
+
+# ============================
+# 제품백서 로딩
+# ============================
+@st.cache_data(show_spinner=False, max_entries=1)
+def _load_product_df_cached(signature):
+    try:
+        # data/.cache 의 가공 완료 프레임을 우선 사용 (CSV가 바뀐 경우에만 재파싱)
+        return read_product_frame()
+    except Exception as e:
+        st.error(f"❌ product_data.csv 불러오기 오류: {e}")
+        return pd.DataFrame()
+
+def load_product_df():
+    """product_data.csv의 (mtime, size)가 바뀔 때만 다시 로딩"""
+    return _load_product_df_cached(csv_signature())
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _get_product_search_index(signature):
+    return ProductSearchIndex.from_frame(_load_product_df_cached(signature))
+
+def get_product_search_index():
+    """제품코드/제품명 검색 인덱스 — 카탈로그 버전당 한 번만 생성"""
+    return _get_product_search_index(csv_signature())
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _get_fulltext_index(signature):
+    return FullTextIndex.load_or_build(_load_product_df_cached(signature), catalogue_version())
+
+def get_fulltext_index():
+    """제품백서 본문 BM25 색인 — 카탈로그 내용 해시별로 data/.cache 에 저장된 것을 읽음"""
+    return _get_fulltext_index(csv_signature())
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _get_spec_table(signature):
+    return SpecTable.from_frame(_load_product_df_cached(signature))
+
+def get_spec_table():
+    """사내/법적 규격 수치 표 (항목 색인 포함) — 카탈로그 버전당 한 번만 파싱"""
+    return _get_spec_table(csv_signature())
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _get_product_options(signature):
+    return build_product_options(_load_product_df_cached(signature))
+
+def get_product_options():
+    """제품 선택 위젯 공용 옵션(라벨 목록 + 코드 → 라벨) — product_data.csv와 함께 무효화"""
+    try:
+        return _get_product_options(csv_signature())
+    except Exception:
+        try:
+            return build_product_options(read_product_frame())
+        except Exception:
+            return EMPTY_OPTIONS
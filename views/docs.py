@@ -0,0 +1,277 @@
+import os
+import sqlite3
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from doc_requests_store import REQUEST_FIELDS, RequestIndex, add_request, get_request_index, update_status
+from product_options import parse_ref_codes, ref_labels
+from upload_index import CERT_NAME_MAP, bundle_loader, cert_key, file_loader, get_upload_index, guess_mime
+from upload_store import store_uploads
+from views.common import (
+    UPLOAD_DIR, _ensure_date_columns, _render_grouped_by_date, get_product_options, load_product_df,
+)
+
+# ============================
+# Helper: doc requests loader
+# ============================
+def _load_doc_requests_index():
+    """서류 요청 인덱스 (data/doc_requests.db, 변경이 있을 때만 재생성)"""
+    try:
+        return get_request_index()
+    except sqlite3.Error as e:
+        st.error(f"❌ 서류 요청 저장소를 읽는 중 오류가 발생했습니다: {e}")
+        return RequestIndex(pd.DataFrame(columns=["request_id"] + REQUEST_FIELDS))
+
+# ============================
+# 페이지: 서류 요청(사용자)
+# ============================
+def page_docs_request_user():
+    st.title("🗂️ 서류 요청 (사용자)")
+    st.caption("예: HACCP, ISO9001, 제품규격, FSSC22000, 할랄, 원산지규격서, MSDS 등")
+    requester = st.text_input("요청자 (이름을 입력하면 '내 요청' 및 '다운로드' 확인 가능)")
+    with st.form("doc_req_form", clear_on_submit=True):
+        col1, col2 = st.columns(2)
+        with col1:
+            team = st.text_input("부서")
+            due = st.date_input("희망 마감일")
+        with col2:
+            st.markdown("**요청 종류**")
+            _colA, _colB, _colC, _colD = st.columns(4)
+            _labels = [
+                "HACCP 인증서", "ISO9001 인증서", "제품규격", "FSSC22000",
+                "할랄인증서", "원산지규격서", "MSDS", "기타",
+            ]
+            _checks = []
+            for idx, lbl in enumerate(_labels):
+                with [_colA, _colB, _colC, _colD][idx % 4]:
+                    _checks.append(st.checkbox(lbl, key=f"req_kind_{idx}"))
+            category = ", ".join([lbl for lbl, on in zip(_labels, _checks) if on])
+            priority = st.select_slider("우선순위", ["낮음","보통","높음","긴급"], value="보통")
+        # 제품선택
+        _opts = get_product_options().labels
+        multi_pick = st.toggle("여러 제품 선택", value=False, help="여러 제품에 대한 요청이라면 켜주세요.")
+        if multi_pick:
+            _picked = st.multiselect("관련 제품코드/명 (검색 가능)", options=_opts, placeholder="예: GID*** | 포도당...")
+            ref_product = ", ".join(_picked) if _picked else ""
+        else:
+            ref_product = st.selectbox("관련 제품코드/명 (선택)", options=[""] + _opts, index=0,
+                                       placeholder="클릭 후 검색/선택",
+                                       help="클릭하면 검색 드롭다운이 열립니다.")
+        details = st.text_area("상세 요청 내용", height=140)
+        files = st.file_uploader("참고 파일 업로드 (다중)", accept_multiple_files=True)
+        submitted = st.form_submit_button("요청 저장")
+        if submitted:
+            if not requester:
+                st.error("요청자 이름을 반드시 입력해주세요.")
+            else:
+                # 첨부는 내용 해시(SHA-256) 기준으로 한 번만 저장 → 같은 이름 덮어쓰기 없음
+                saved_files = store_uploads(files)
+                rec = {
+                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    "requester": requester, "team": team, "due": str(due),
+                    "category": category, "priority": priority, "ref_product": ref_product,
+                    "details": details, "files": saved_files, "status": "대기"
+                }
+                request_id = add_request(rec)
+                st.success(f"요청이 저장되었습니다. (요청 ID: {request_id})")
+    # 🔒 사용자 페이지는 '전체 요청 현황'을 보여주지 않음 (본인 것만)
+    st.markdown("---")
+    st.subheader("내 요청 & 다운로드")
+    if not requester:
+        st.caption("상단의 '요청자'에 이름을 입력하면, 본인의 요청 내역 및 승인된 파일 다운로드 섹션이 나타납니다.")
+        return
+    try:
+        # 요청자별 행 위치 사전으로 바로 조회 (전체 표 필터링 없음)
+        _mine = _load_doc_requests_index().for_requester(requester)
+        if _mine.empty:
+            st.info("본인 이름으로 접수된 요청이 없습니다.")
+            return
+
+        # 2) 사용자 페이지(내 요청) — “일별 보기”로 교체
+        # 기존: st.dataframe(_mine.tail(20), ...)
+        # 교체: 날짜 그룹 선택 + 그룹 표시
+        st.write(f"**'{requester}'님의 요청 (일별 보기)**")
+
+        # 날짜 컬럼 추가
+        _mine2 = _ensure_date_columns(_mine)
+
+        # 그룹 기준 선택
+        group_choice = st.radio("그룹 기준", ["요청일(입력시각)", "마감일"], horizontal=True, key="user_group_choice")
+        group_key = "요청일" if group_choice == "요청일(입력시각)" else "마감일"
+
+        # (선택) 최근 N일만 보기 필터
+        recent_days = st.slider("최근 N일만 보기 (0=전체)", min_value=0, max_value=60, value=0, step=5, key="user_recent_days")
+        if recent_days > 0 and not _mine2.empty:
+            cutoff = pd.Timestamp.today().date() - pd.Timedelta(days=recent_days)
+            _mine2 = _mine2[_mine2[group_key] >= cutoff]
+
+        # 날짜별 접기 테이블
+        _user_cols = ["timestamp", "team", "due", "category", "priority", "ref_product", "status", "details"]
+        _user_cols = [c for c in _user_cols if c in _mine2.columns]
+        _render_grouped_by_date(_mine2, group_key, _user_cols)
+
+        _approved_list = _mine[_mine["status"] == "승인"]
+        if _approved_list.empty:
+            st.info("아직 승인된 요청이 없습니다.")
+            return
+
+        st.markdown("---")
+        st.success("✅ **승인된 요청 파일 다운로드**")
+        st.info("파일명 규칙: `제품코드_인증서키.확장자` (예: GIS7030_HACCP.pdf)")
+        # data/uploads 색인 (디렉터리가 바뀐 경우에만 재스캔) → 파일마다 os.path.exists 하지 않음
+        _uploads = get_upload_index(UPLOAD_DIR)
+        _label_by_code = get_product_options().label_by_code
+        found_any_files_globally = False
+        for _, approved_req in _approved_list.iterrows():
+            _cat_str = approved_req.get("category", "")
+            _prod_str = approved_req.get("ref_product", "")
+            with st.container(border=True):
+                # ✅ 파이프(|) 유무와 상관없이 코드 인식 (코드만 저장된 요청도 "코드 | 제품명"으로 표시)
+                product_codes = parse_ref_codes(_prod_str) or ['N/A']
+                _prod_labels = ref_labels(_prod_str, _label_by_code)
+                st.write(f"**요청일: {approved_req.get('timestamp')} / 제품: {', '.join(_prod_labels) if _prod_labels else 'N/A'}**")
+                requested_certs = [c.strip() for c in str(_cat_str).split(',') if c.strip()]
+                if not requested_certs:
+                    st.write("다운로드할 인증서 종류가 지정되지 않았습니다.")
+                    continue
+                files_for_this_request = []
+                for code in product_codes:
+                    if code == 'N/A':
+                        continue
+                    for cert_label in requested_certs:
+                        _key = cert_key(cert_label)
+                        hit = _uploads.find(code, _key)
+                        if hit:
+                            fpath, fname = hit
+                            files_for_this_request.append({"path": fpath, "name": fname,
+                                                           "label": f"{code} - {cert_label}"})
+                            found_any_files_globally = True
+                        elif cert_label != "기타":
+                            st.warning(f"❌ '{code} - {cert_label}' 파일을 찾을 수 없습니다. "
+                                       f"(예상: `{code}_{_key}.*` in `{os.path.abspath(UPLOAD_DIR)}`)")
+                if files_for_this_request:
+                    # 파일 내용은 버튼을 누를 때만 읽음 (렌더링 시 메모리/전송량은 파일 수·크기와 무관)
+                    _rid = approved_req.get("request_id", "")
+                    for file_info in files_for_this_request:
+                        st.download_button(
+                            label=f"⬇️ {file_info['label']}",
+                            data=file_loader(file_info["path"]),
+                            file_name=file_info["name"],
+                            mime=guess_mime(file_info["name"]),
+                            key=f"dl_{_rid}_{file_info['name']}",
+                        )
+                    if len(files_for_this_request) > 1:
+                        st.download_button(
+                            label=f"📦 이 요청 파일 전체 (zip, {len(files_for_this_request)}개)",
+                            data=bundle_loader([(f["path"], f["name"]) for f in files_for_this_request]),
+                            file_name=f"{_rid or 'request'}.zip",
+                            mime="application/zip",
+                            key=f"dl_{_rid}_bundle",
+                        )
+        if not found_any_files_globally:
+            st.info("다운로드 가능한 승인된 파일이 없습니다. 품질팀에 문의하세요.")
+    except FileNotFoundError:
+        st.info("아직 요청 기록이 없습니다.")
+    except Exception as e:
+        st.error(f"내 요청을 불러오는 중 오류 발생: {e}")
+
+# ============================
+# 페이지: 서류 승인(관리자)
+# ============================
+def page_docs_admin():
+    st.title("🛡️ 서류 승인 (관리자)")
+    st.caption("품질팀 전용: 전체 요청 조회 및 승인/반려 처리")
+    _admin_pw = st.text_input("관리자 암호", type="password", key="admin_pw")
+    _ADMIN = os.environ.get("INCHON1_ADMIN_PW", "quality#77")
+    if not _admin_pw:
+        st.info("관리자 암호를 입력하세요.")
+        return
+    if _admin_pw != _ADMIN:
+        st.error("관리자 암호가 올바르지 않습니다.")
+        return
+    try:
+        req_index = _load_doc_requests_index()
+        df = req_index.df
+        
+        # 3) 관리자 페이지(전체 요청) — “일별 보기 + 기간 필터” 추가
+        st.subheader("📋 전체 요청 목록 (일별 보기)")
+
+        df2 = _ensure_date_columns(df)
+
+        # 필터: 그룹 기준 + 기간
+        colA, colB, colC = st.columns([1.2, 1, 2])
+        with colA:
+            group_choice = st.radio("그룹 기준", ["요청일(입력시각)", "마감일"], horizontal=True, key="admin_group_choice")
+            group_key = "요청일" if group_choice == "요청일(입력시각)" else "마감일"
+
+        with colB:
+            recent_days = st.slider("최근 N일", min_value=0, max_value=180, value=30, step=10, key="admin_recent_days")
+
+        with colC:
+            status_filter = st.multiselect("상태 필터", ["대기", "진행중", "승인", "반려"], default=["대기","진행중","승인","반려"], key="admin_status_filter")
+
+        # 상태 필터 적용
+        if status_filter:
+            df2 = df2[df2["status"].isin(status_filter)]
+
+        # 기간 필터 적용
+        if recent_days > 0 and not df2.empty:
+            cutoff = pd.Timestamp.today().date() - pd.Timedelta(days=recent_days)
+            df2 = df2[df2[group_key] >= cutoff]
+
+        _admin_cols = ["timestamp", "requester", "team", "due", "category", "priority", "ref_product", "status", "details"]
+        _admin_cols = [c for c in _admin_cols if c in df2.columns]
+        _render_grouped_by_date(df2, group_key, _admin_cols)
+        
+        # 📄 전 제품 인증서 보유 현황 (data/uploads 색인 기준)
+        with st.expander("📄 인증서 누락 현황 (전체 제품)", expanded=False):
+            _report_certs = st.multiselect("인증서 종류", [l for l in CERT_NAME_MAP if l != "기타"],
+                                           default=["HACCP 인증서"], key="admin_missing_certs")
+            _products = load_product_df()
+            if _report_certs and not _products.empty:
+                _report = get_upload_index(UPLOAD_DIR).missing_report(
+                    _products["제품코드"].dropna().unique(), _report_certs)
+                _missing = _report[~_report.all(axis=1)]
+                st.write(f"전체 {len(_report)}개 제품 중 누락 있는 제품 {len(_missing)}개")
+                st.dataframe((~_report).sum().rename("누락 건수").to_frame().T, use_container_width=True)
+                st.dataframe(
+                    _missing.reset_index().merge(
+                        _products[["제품코드", "제품명"]].drop_duplicates("제품코드"), on="제품코드", how="left"
+                    ).replace({True: "✅", False: "❌"}),
+                    use_container_width=True,
+                )
+
+        st.markdown("---") # Add a separator before the form
+        
+        # 위치 인덱스 대신 영구 request_id로 선택 → 동시 추가/삭제가 있어도 다른 요청을 건드리지 않음
+        _pick_df = df2 if not df2.empty else df
+        _pick_ids = _pick_df["request_id"].tolist()[::-1]   # 최신 요청이 위로
+
+        def _request_label(rid):
+            r = req_index.get(rid) or {}
+            return f"{rid} | {r.get('requester', '')} | {r.get('category', '')} | {r.get('status', '')}"
+
+        with st.form("admin_form"):
+            colA, colB = st.columns([1, 2])
+            with colA:
+                sel_id = st.selectbox("승인/반려할 요청 ID", _pick_ids, format_func=_request_label,
+                                      index=0 if _pick_ids else None, placeholder="요청이 없습니다")
+            with colB:
+                status_options = ["승인","반려","대기","진행중"]
+                _sel = req_index.get(sel_id) if sel_id else None
+                current_status = _sel["status"] if _sel else '대기'
+                default_index = status_options.index(current_status) if current_status in status_options else 2
+                new_status = st.selectbox("처리 상태", status_options, index=default_index)
+            submitted = st.form_submit_button("상태 반영")
+            if submitted:
+                if sel_id and update_status(sel_id, new_status):
+                    st.success(f"요청 {sel_id}의 상태가 '{new_status}'(으)로 변경되었습니다. 새로고침 후 확인하세요.")
+                else:
+                    st.warning("선택된 ID에 해당하는 요청이 없습니다.")
+    except FileNotFoundError:
+        st.info("요청 기록이 없습니다.")
+    except Exception as e:
+        st.error(f"관리자 뷰 로딩 중 오류: {e}")
+        st.exception(e)
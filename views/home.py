@@ -0,0 +1,75 @@
+import streamlit as st
+
+# ============================
+# 페이지: 홈 (대시보드)
+# ============================
+
+def page_home():
+    st.markdown("<h1 class='home-title'>🏭 인천1공장 AI 에이전트 🏭</h1>", unsafe_allow_html=True)
+    st.markdown("<p class='home-sub'>주요 기능을 한 곳에서 빠르게 이동하세요.</p>", unsafe_allow_html=True)
+    st.markdown("<div class='fake-input-btn'>", unsafe_allow_html=True)
+    clicked = st.button("인천 1공장 AI 챗봇에게 질문하기...", use_container_width=True, key="fake_search")
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    if clicked:
+        st.session_state["page"] = "인천 1공장 AI 챗봇"
+        st.rerun()
+
+    # 카드 데이터
+    cards = [
+        {
+            "emoji": "🤖",
+            "title": "인천 1공장 AI 챗봇",
+            "desc": "질문하면 바로 챗봇으로 이동합니다.",
+            "goto": "인천 1공장 AI 챗봇",
+        },
+        {
+            "emoji": "📘",
+            "title": "제품 백서",
+            "desc": "제품 정보, 규격, COA를 확인합니다.",
+            "goto": "제품백서",
+        },
+        {
+            "emoji": "⚙️",
+            "title": "공정 일일 작업기록",
+            "desc": "일일 생산/공정 데이터를 입력·조회합니다.",
+            "goto": "공정 일일 작업기록",
+        },
+    ]
+
+
+    cols = st.columns(len(cards))
+
+    for col, c in zip(cols, cards):
+        with col:
+            # 이 컨테이너에만 흰 테두리 카드 스타일을 적용
+            with st.container(border=True):
+                # CSS가 이 컨테이너를 찾을 수 있도록 마커 하나 심어두기
+                st.markdown("<span class='home-card-marker'></span>", unsafe_allow_html=True)
+
+                # 제목
+                st.markdown(
+                    f"""
+                    <h4 style="margin-bottom: 4px;">
+                        {c['emoji']} {c['title']}
+                    </h4>
+                    """,
+                    unsafe_allow_html=True
+                )
+
+                # 설명
+                st.markdown(
+                    f"""
+                    <p style="font-size: 0.9rem; color: #f0f0f0;">
+                        {c['desc']}
+                    </p>
+                    """,
+                    unsafe_allow_html=True
+                )
+
+                st.write("")  # 여백
+
+                # 버튼 (Streamlit 버튼 그대로 사용)
+                if st.button("바로가기", key=f"go_{c['goto']}"):
+                    st.session_state["page"] = c["goto"]
+                    st.rerun()
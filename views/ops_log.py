@@ -0,0 +1,292 @@
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from ops_anomaly import Z_THRESHOLD, flags_frame, link_voc, update_anomalies
+from ops_log_store import SHOW_COLUMNS as OPS_SHOW_COLUMNS, OpsLogStore
+from views.common import get_product_options
+from views.voc import _append_voc
+
+# ============================
+# 페이지: 공정 일일 작업기록
+# ============================
+def page_ops_log():
+    st.title("⚙️ 공정 일일 작업기록")
+    st.caption("인천1공장 일일 공정 운영 내용을 입력/저장하는 화면입니다.")
+
+
+    # 제품코드 선택 옵션 (기존 product_data 활용, 공용 캐시)
+    prod_opts = get_product_options().labels
+
+    # 월별 파티션 저장소 (기존 operation_logs.csv는 최초 실행 시 자동 이전)
+    ops_store = OpsLogStore()
+
+    # ---------- 입력 폼 ----------
+    with st.form("ops_log_form", clear_on_submit=False):
+        st.subheader("📥 작업 내용 입력")
+
+        # 1행 : 날짜
+        col_date, col_empty1, col_empty2 = st.columns([1, 1, 1])
+        with col_date:
+            date = st.date_input("날짜 (yyyy-mm-dd 형식)")
+
+
+        st.markdown("### 1️⃣ 전분 공정")
+
+        # 🔹 1행: 파쇄 RPM / 파쇄량 / 파쇄량 누계(읽기 전용 안내)
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            crush_rpm = st.text_area(
+                "파쇄 RPM (시간대별로 여러 개 입력 가능)",
+                height=48,   # ⭐ 핵심 (number_input과 거의 동일)
+                help="예: 08:00-1500, 10:00-1600 처럼 시간-회전수를 쉼표/줄바꿈으로 구분해서 입력"
+            )
+        with c2:
+            crush_ton_day = st.number_input("파쇄량(톤/일)", min_value=0.0, step=0.1)
+        with c3:
+            st.text_input(
+                "파쇄량 누계(톤)",
+                value="저장 후 자동 계산됩니다.",
+                disabled=True,
+                help="입력할 필요 없습니다. 아래 표에서 자동 누계가 계산됩니다."
+            )
+
+        # 🔹 2행: 공침지조 / 수전분 재공 / LSW재공 / CSL드레인 COD
+        c4, c5, c6, c7 = st.columns(4)
+        with c4:
+            co_precipitation = st.number_input("공침지조(기)", min_value=0.0, step=1.0)
+        with c5:
+            slurry_wip = st.number_input("수전분 재공(m³)", min_value=0.0, step=0.1)
+        with c6:
+            lsw_wip = st.number_input("LSW재공(m³)", min_value=0.0, step=0.1)
+        with c7:
+            csl_cod = st.number_input("CSL드레인 COD", min_value=0.0, step=1.0)
+
+        c8, c9, c10= st.columns(3)
+        with c8:
+            gongdanghwa = st.number_input("공당화(m³)", min_value=0.0, step=0.1)
+        with c9:
+            liquefaction_rpm = st.number_input("액화 RPM", min_value=0.0, step=1.0)
+        with c10:
+            waste_water = st.number_input("폐수 처리량(m³)", min_value=0.0, step=0.1)
+
+                 # === 2️⃣ 생산량 + 3️⃣ 제품코드 선택 (좌우 배치) ===
+        left_col, right_col = st.columns([1, 1])
+
+        # 🔹 왼쪽 : 2️⃣ 생산량
+        with left_col:
+            st.markdown("### 2️⃣ 생산량")
+            food_prod = st.number_input("식품용 생산량(톤)", min_value=0.0, step=0.1)
+            ind_prod = st.number_input("산업용 생산량(톤)", min_value=0.0, step=0.1)
+            level_1000 = st.number_input("1000m³ 레벨", min_value=0.0, step=0.1)
+            level_700 = st.number_input("700m³ 레벨", min_value=0.0, step=0.1)
+
+            # 🔹 700m³ 레벨 아래에 '일 생산량(톤) 합계' 자동 계산 표시
+            daily_total = food_prod + ind_prod
+            st.text_input(
+                "일 생산량(톤) 합계",
+                value=f"{daily_total:.2f}",
+                disabled=True,
+                help="식품용 + 산업용 생산량의 합계가 자동 계산되어 표시됩니다."
+            )
+
+            st.caption("➕ `일 생산량(톤)`과 `누계`는 저장 후 아래 표에서 다시 자동 계산됩니다.")
+
+        # 🔹 오른쪽 : 3️⃣ 제품코드 선택
+        with right_col:
+            st.markdown("""
+            <h3 class="ops-title">
+              <span>3️⃣ 제품코드 선택</span>
+              <span class="nums">(201 / 301 / 701 / 801 / 250)</span>
+            </h3>
+            """, unsafe_allow_html=True)
+
+
+            def _prod_select(label, key):
+                if prod_opts:
+                    return st.selectbox(label, [""] + prod_opts, key=key)
+                return st.text_input(label + " (제품데이터 미로딩 시 직접입력)", key=key)
+
+            prod_201 = _prod_select("201 제품코드", "prod_201")
+            prod_301 = _prod_select("301 제품코드", "prod_301")
+            prod_701 = _prod_select("701 제품코드", "prod_701")
+            prod_801 = _prod_select("801 제품코드", "prod_801")
+            prod_250 = _prod_select("250 제품코드", "prod_250")
+
+        # === 4️⃣ 양성 / D·D  +  5️⃣ 특이사항 (2번/3번처럼 좌우 배치) ===
+        col_4, col_5 = st.columns([1, 1.2])
+
+        # 🔹 왼쪽 : 4️⃣ 양성 / D·D
+        with col_4:
+            st.markdown("### 4️⃣ 양성 / D/D")
+            c15, c16 = st.columns(2)
+            with c15:
+                yang_pre = _prod_select("양성 (Pre-mixing 제품코드)", "yang_pre")
+            with c16:
+                yang_final = _prod_select("양성 (Final-mixing 제품코드)", "yang_final")
+
+            # D/D는 한 줄 전체 사용
+            dd_prod = _prod_select("D/D 제품코드", "dd_prod")
+
+        # 🔹 오른쪽 : 5️⃣ 특이사항
+        with col_5:
+            st.markdown("### 5️⃣ 특이사항")
+            maintenance = st.text_area(
+                "설비 보수 & 공사 사항",
+                help="여러 건일 경우 줄바꿈으로 구분해서 입력"
+            )
+            special_note = st.text_area(
+                "작업 특기 사항",
+                help="여러 건일 경우 줄바꿈으로 구분해서 입력"
+            )
+
+        btn_col1, btn_col2 = st.columns([7, 1])
+        with btn_col2:
+            submitted = st.form_submit_button("💾 작업기록 저장")
+
+
+        if submitted:
+            rec = {
+                "날짜": str(date),
+                "파쇄 RPM": crush_rpm,
+                "파쇄량(톤/일)": crush_ton_day,
+                "수전분 재공(m3)": slurry_wip,
+                "공침지조(기)": co_precipitation,
+                "LSW재공(m3)": lsw_wip,
+                "CSL드레인 COD": csl_cod,
+                "공당화(m3)": gongdanghwa,
+                "액화 RPM": liquefaction_rpm,
+                "식품용 생산량(톤)": food_prod,
+                "산업용 생산량(톤)": ind_prod,
+                "1000m3 레벨": level_1000,
+                "700m3 레벨": level_700,
+                "폐수 처리량(m3)": waste_water,
+                "201": prod_201,
+                "301": prod_301,
+                "701": prod_701,
+                "801": prod_801,
+                "250": prod_250,
+                "양성_Pre": yang_pre,
+                "양성_Final": yang_final,
+                "D/D": dd_prod,
+                "설비 보수 & 공사 사항": maintenance,
+                "작업 특기 사항": special_note,
+                "입력시각": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            }
+
+            # 해당 월 파티션에 저장 (월 누계는 저장 시점에 갱신)
+            ops_store.append_day(rec)
+
+            st.success("✅ 작업기록이 저장되었습니다.")
+
+    # ---------- 저장된 작업기록 조회 (기간과 겹치는 월 파일만, 한 페이지씩 읽음) ----------
+    months = ops_store.months()
+    if months:
+        # 이상 감지는 마지막 처리 이후의 새 기록만 반영
+        anomalies = update_anomalies(ops_store)
+        st.markdown("---")
+        st.subheader("📊 저장된 작업기록 / 누계 자동계산")
+
+        view_mode = st.radio("조회 단위", ["월별", "기간 지정"], horizontal=True, key="ops_view_mode")
+        if view_mode == "월별":
+            sel_month = st.selectbox("조회 월", months[::-1], key="ops_view_month")
+            start = pd.Timestamp(f"{sel_month}-01").date()
+            end = (pd.Timestamp(start) + pd.offsets.MonthEnd(0)).date()
+
+            # 월 합계는 매니페스트에 저장된 값 사용 (파일 재집계 없음)
+            summary = ops_store.month_summary(sel_month)
+            totals = summary.get("totals", {})
+            m1, m2, m3, m4 = st.columns(4)
+            m1.metric("기록 일수", f"{summary.get('rows', 0)}일")
+            m2.metric("파쇄량 누계(톤)", f"{totals.get('파쇄량(톤/일)', 0):,.1f}")
+            m3.metric("식품용 / 산업용 누계(톤)",
+                      f"{totals.get('식품용 생산량(톤)', 0):,.1f} / {totals.get('산업용 생산량(톤)', 0):,.1f}")
+            m4.metric("전체 누계(톤)", f"{totals.get('일 생산량(톤)', 0):,.1f}")
+        else:
+            last_date = pd.Timestamp(ops_store.month_summary(months[-1])["last_date"]).date()
+            date_range = st.date_input(
+                "조회 기간",
+                value=((pd.Timestamp(last_date) - pd.Timedelta(days=30)).date(), last_date),
+                key="ops_view_range",
+            )
+            if not (isinstance(date_range, (list, tuple)) and len(date_range) == 2):
+                st.info("조회 종료일까지 선택해 주세요.")
+                return
+            start, end = date_range
+
+        pc1, pc2, pc3 = st.columns([1, 1, 2])
+        with pc1:
+            page_size = st.selectbox("페이지당 행 수", [31, 50, 100], key="ops_page_size")
+        total_rows = ops_store.count_range(start, end)
+        n_pages = max(1, -(-total_rows // page_size))
+        with pc2:
+            # 기간/페이지 크기가 바뀌면 마지막(최신) 페이지부터 다시 시작
+            page = st.number_input(
+                "페이지", min_value=1, max_value=n_pages, value=n_pages, step=1,
+                key=f"ops_page_{start}_{end}_{page_size}",
+            )
+        with pc3:
+            st.caption(f"{start} ~ {end} · 총 {total_rows}건 · {int(page)}/{n_pages} 페이지")
+
+        if total_rows == 0:
+            st.info("선택한 기간에 저장된 작업기록이 없습니다.")
+        else:
+            df = ops_store.read_range_page(start, end, int(page), page_size)
+            df["날짜"] = pd.to_datetime(df["날짜"], errors="coerce")
+            show_cols = [c for c in OPS_SHOW_COLUMNS if c in df.columns]
+            # 이상 감지된 (날짜, 지표) 칸 강조
+            st.dataframe(
+                df[show_cols].style.apply(_anomaly_styles, axis=None, flags=anomalies.get("flags", [])),
+                use_container_width=True,
+            )
+
+        _ops_anomaly_panel(ops_store, anomalies)
+    else:
+        st.info("저장된 작업기록이 아직 없습니다.")
+
+
+def _anomaly_styles(frame: pd.DataFrame, flags) -> pd.DataFrame:
+    styles = pd.DataFrame("", index=frame.index, columns=frame.columns)
+    dates = frame["날짜"].dt.strftime("%Y-%m-%d")
+    for f in flags:
+        if f["metric"] in styles.columns:
+            styles.loc[dates == f["date"], f["metric"]] = "background-color: #ffd6d6; font-weight: 600"
+    return styles
+
+
+def _ops_anomaly_panel(ops_store, anomalies: dict):
+    """감지 목록 + 선택한 감지 항목을 VOC(내부 이상)로 등록하고 연결"""
+    flags = flags_frame(anomalies)
+    with st.expander(f"⚠️ 이상 감지 (EWMA z-score, |z| > {Z_THRESHOLD:g}) · {len(flags)}건", expanded=False):
+        if flags.empty:
+            st.caption("감지된 이상이 없습니다.")
+            return
+        st.dataframe(
+            flags.rename(columns={"date": "날짜", "metric": "지표", "value": "값",
+                                  "expected": "EWMA 기대값", "z": "z", "voc": "연결된 VOC"}),
+            use_container_width=True, height=240,
+        )
+        open_flags = flags[flags["voc"].isna()]
+        if open_flags.empty:
+            return
+        with st.form("ops_anomaly_voc_form", clear_on_submit=True):
+            pick = st.selectbox(
+                "VOC로 등록할 감지 항목", open_flags.index.tolist(),
+                format_func=lambda i: f"{open_flags.at[i, 'date']} · {open_flags.at[i, 'metric']} "
+                                      f"= {open_flags.at[i, 'value']:g} (z={open_flags.at[i, 'z']:+.1f})",
+            )
+            severity = st.select_slider("심각도", ["Low", "Medium", "High", "Critical"], value="Medium")
+            note = st.text_input("메모 (선택)")
+            if st.form_submit_button("VOC 등록"):
+                flag = open_flags.loc[pick]
+                voc_ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                _append_voc({
+                    "timestamp": voc_ts, "date": flag["date"], "type": "내부 이상", "severity": severity,
+                    "product": "",
+                    "desc": f"[공정 이상 자동감지] {flag['metric']} {flag['value']:g} "
+                            f"(EWMA 기대값 {flag['expected']:g}, z={flag['z']:+.1f})" + (f" — {note}" if note else ""),
+                    "cause": "", "action": "", "files": "",
+                })
+                link_voc(ops_store, flag["date"], flag["metric"], voc_ts)
+                st.success(f"VOC가 등록되었습니다. (VOC 입력시각 {voc_ts})")
@@ -0,0 +1,55 @@
+import pandas as pd
+import streamlit as st
+
+from ops_log_store import OpsLogStore
+from ops_trends import GRANULARITIES, TREND_METRICS, downsample, trend_series
+
+# ============================
+# 페이지: 공정 트렌드
+# ============================
+@st.cache_data(show_spinner=False, max_entries=64)
+def _ops_trend_cached(metric, granularity, start, end, revisions):
+    """
+    (지표, 단위, 기간, 구간 내 월별 revision) 별 집계 + 다운샘플 결과 캐시.
+    revisions는 키로만 쓰임 — 기간 안의 달에 기록이 추가/수정될 때만 바뀐다.
+    """
+    series = trend_series(OpsLogStore().read_range(start, end), metric, granularity)
+    return downsample(series), len(series)
+
+
+def page_ops_trend():
+    st.title("📈 공정 트렌드")
+
+    ops_store = OpsLogStore()
+    months = ops_store.months()
+    if not months:
+        st.info("저장된 작업기록이 아직 없습니다.")
+        return
+
+    first_date = pd.Timestamp(f"{months[0]}-01").date()
+    last_date = pd.Timestamp(ops_store.month_summary(months[-1])["last_date"]).date()
+
+    c1, c2, c3 = st.columns([2, 2, 3])
+    with c1:
+        metric = st.selectbox("지표", TREND_METRICS, key="trend_metric")
+    with c2:
+        granularity = st.radio("단위", list(GRANULARITIES), horizontal=True, key="trend_granularity")
+    with c3:
+        date_range = st.date_input(
+            "기간", value=(first_date, last_date),
+            min_value=first_date, max_value=last_date, key="trend_range",
+        )
+    if not (isinstance(date_range, (list, tuple)) and len(date_range) == 2):
+        st.info("조회 종료일까지 선택해 주세요.")
+        return
+    start, end = date_range
+
+    chart_df, n_points = _ops_trend_cached(
+        metric, granularity, start, end, ops_store.range_revisions(start, end)
+    )
+    if chart_df.empty:
+        st.info("선택한 기간에 해당 지표 기록이 없습니다.")
+        return
+    st.line_chart(chart_df, use_container_width=True)
+    st.caption(f"{start} ~ {end} · {granularity} {n_points}개 구간"
+               + (f" → 화면 표시 {len(chart_df)}점 (LTTB)" if len(chart_df) < n_points else ""))
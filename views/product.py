@@ -0,0 +1,235 @@
+import html
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from fulltext_search import TEXT_FIELDS, snippets
+from spec_table import OP_MAX, OP_MIN, OP_NOT_DETECTED
+from views.common import get_fulltext_index, get_product_search_index, get_spec_table, load_product_df
+from whitepaper import render_card_html, render_cards_html, select_products
+
+# ============================
+# 페이지: 제품백서에서 쓰는 카드 UI
+# ============================
+def product_card(row):
+    # 규격 파싱/서식 처리/HTML 조립은 whitepaper 모듈에서 제품별로 한 번만 수행
+    html_template = render_card_html(row)
+
+    st.components.v1.html(html_template, height=2200, scrolling=True)
+
+
+def product_cards(results):
+    """검색 결과 카드 전체를 iframe 하나로 (공용 CSS/JS 한 번, 화면 밖 카드는 스크롤 시 생성)"""
+    if len(results) == 1:
+        product_card(results.iloc[0])
+        return
+    html = render_cards_html([row for _, row in results.iterrows()])
+    st.components.v1.html(html, height=2200, scrolling=True)
+
+
+# ============================
+# 페이지: 제품백서
+# ============================
+def page_product():
+    # 🔽 실제 제품백서 기능 부분 (기존 로직)
+    st.title("📘 제품백서")
+
+    df = load_product_df()
+
+    with st.expander("📋 인천 1공장 전제품 목록", expanded=False):
+        st.dataframe(
+            df[["계층구조_2레벨","계층구조_3레벨","제품코드","제품명"]]
+              .dropna()
+              .reset_index(drop=True),
+            use_container_width=True
+        )
+
+    # 📦 제품백서 일괄 PDF 내보내기 (품질 감사용)
+    with st.expander("📦 제품백서 일괄 PDF 내보내기", expanded=False):
+        ec1, ec2 = st.columns(2)
+        with ec1:
+            exp_level2 = st.multiselect("계층구조 2레벨", sorted(df["계층구조_2레벨"].dropna().unique()),
+                                        key="export_level2")
+        with ec2:
+            exp_level3 = st.multiselect("계층구조 3레벨", sorted(df["계층구조_3레벨"].dropna().unique()),
+                                        key="export_level3")
+        exp_codes = st.text_input("제품코드 (쉼표로 구분, 비우면 위 조건 전체)", key="export_codes")
+        exp_fmt = st.radio("출력 형식", ["병합 PDF", "ZIP (제품별 PDF)"], horizontal=True, key="export_fmt")
+        targets = select_products(df, exp_level2, exp_level3, exp_codes.split(",") if exp_codes else None)
+        st.caption(f"선택된 제품: {len(targets)}개")
+        if st.button("PDF 생성", key="export_run", disabled=targets.empty):
+            fmt = "zip" if exp_fmt.startswith("ZIP") else "pdf"
+            try:
+                with st.spinner(f"{len(targets)}개 제품백서 PDF 생성 중..."):
+                    # fpdf/pypdf는 실제로 내보낼 때만 import (제품백서 첫 화면 로딩 단축)
+                    from whitepaper_pdf import export_whitepapers
+                    data = export_whitepapers(targets, fmt=fmt)
+                st.session_state["export_result"] = (fmt, data)
+            except FileNotFoundError as e:
+                st.error(f"❌ {e}")
+        if "export_result" in st.session_state:
+            fmt, data = st.session_state["export_result"]
+            st.download_button(
+                label=f"⬇️ 제품백서.{fmt} 다운로드 ({len(data) / 1024:.0f} KB)",
+                data=data,
+                file_name=f"제품백서_{datetime.now().strftime('%Y%m%d_%H%M')}.{fmt}",
+                mime="application/zip" if fmt == "zip" else "application/pdf",
+            )
+
+    st.markdown("---")
+    mode = st.radio("보기", ["🔍 검색", "📝 본문 검색", "🧮 필터·비교"], horizontal=True, key="product_mode",
+                    label_visibility="collapsed")
+    if mode == "🧮 필터·비교":
+        _product_filter_view(df)
+        return
+    if mode == "📝 본문 검색":
+        _product_fulltext_view(df)
+        return
+
+    st.markdown(
+        '<h4>🔍 <b>제품코드 또는 제품명을 입력하세요</b></h4>',
+        unsafe_allow_html=True
+    )
+
+    col1, col2 = st.columns(2)
+    with col1:
+        q1 = st.text_input("🔎 제품 1 (예: GIB1010 또는 글루텐피드)")
+    with col2:
+        q2 = st.text_input("🔎 제품 2 (예: GIS7030 또는 물엿)")
+
+    queries = [q for q in [q1, q2] if q]
+
+    if queries:
+        # 인덱스 조회 → 중복 제거 + 순위(코드 일치 > 코드 접두어 > 제품명) 정렬된 행 위치
+        positions = get_product_search_index().search_many(queries)
+        results = df.iloc[positions]
+
+        if results.empty:
+            st.warning("🔍 검색 결과가 없습니다.")
+        else:
+            product_cards(results)
+    else:
+        st.info("제품코드 또는 제품명을 입력해주세요.")
+
+
+# ============================
+# 제품백서: 필터·비교 (카드 iframe 대신 표 한 장, 페이지 단위)
+# ============================
+MATRIX_PAGE_SIZES = [20, 50, 100]
+MATRIX_BASE_COLUMNS = ["제품코드", "제품명", "계층구조_2레벨", "계층구조_3레벨", "식품유형", "구분", "소비기한"]
+MATRIX_DEFAULT_ITEMS = 4        # 규격 조건이 없을 때 표에 붙일 공통 항목 수
+COMPARE_MAX = 4
+
+
+def _options(df: pd.DataFrame, column: str) -> list:
+    return sorted(df[column].dropna().astype(str).unique()) if column in df.columns else []
+
+
+def _isin(df: pd.DataFrame, column: str, picked) -> pd.Series:
+    if not picked or column not in df.columns:
+        return pd.Series(True, index=df.index)
+    return df[column].astype(str).isin(picked)
+
+
+def _product_filter_view(df: pd.DataFrame):
+    spec = get_spec_table()
+
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        level2 = st.multiselect("계층구조 2레벨", _options(df, "계층구조_2레벨"), key="pf_level2")
+        # 3레벨 선택지는 고른 2레벨 안에서만
+        level3 = st.multiselect("계층구조 3레벨", _options(df[_isin(df, "계층구조_2레벨", level2)], "계층구조_3레벨"),
+                                key="pf_level3")
+    with c2:
+        food_types = st.multiselect("식품유형", _options(df, "식품유형"), key="pf_food_type")
+        kinds = st.multiselect("구분", _options(df, "구분"), key="pf_kind")
+    with c3:
+        shelf_lives = st.multiselect("소비기한", _options(df, "소비기한"), key="pf_shelf_life")
+        source = st.radio("규격 기준", ["전체", "사내", "법적"], horizontal=True, key="pf_source")
+
+    spec_items = st.multiselect("규격 조건 (수치 항목)", spec.items(numeric_only=True), key="pf_spec_items",
+                                placeholder="예: 수분, DE, pH ...")
+    conditions = []
+    for item in spec_items:
+        lo, hi = spec.bounds(item) or (0.0, 0.0)
+        s1, s2, s3 = st.columns([2, 2, 3])
+        with s1:
+            st.markdown(f"**{item}**")
+        with s2:
+            op = st.selectbox("조건", [OP_MAX, OP_MIN, OP_NOT_DETECTED], key=f"pf_op_{item}",
+                              label_visibility="collapsed")
+        with s3:
+            value = st.number_input("값", value=hi if op == OP_MAX else lo, key=f"pf_val_{item}_{op}",
+                                    label_visibility="collapsed", disabled=op == OP_NOT_DETECTED)
+        conditions.append((item, op, value))
+
+    mask = (_isin(df, "계층구조_2레벨", level2) & _isin(df, "계층구조_3레벨", level3)
+            & _isin(df, "식품유형", food_types) & _isin(df, "구분", kinds) & _isin(df, "소비기한", shelf_lives))
+    codes = df["제품코드"].astype(str).str.strip()
+    if conditions:
+        mask &= codes.isin(spec.query(conditions, None if source == "전체" else source))
+    matched = df[mask]
+
+    st.caption(f"조건에 맞는 제품: {len(matched)}개")
+    if matched.empty:
+        st.warning("🔍 조건에 맞는 제품이 없습니다.")
+        return
+
+    p1, p2 = st.columns([1, 1])
+    with p1:
+        page_size = st.selectbox("페이지당 제품 수", MATRIX_PAGE_SIZES, key="pf_page_size")
+    n_pages = -(-len(matched) // page_size)
+    with p2:
+        page_no = st.number_input(f"페이지 (1~{n_pages})", min_value=1, max_value=n_pages, value=1, step=1,
+                                  key=f"pf_page_{len(matched)}_{page_size}")
+    page = matched.iloc[(page_no - 1) * page_size: page_no * page_size]
+
+    # 표시할 페이지의 제품만 규격 표에서 잘라 붙임
+    items = spec_items or spec.items(numeric_only=True)[:MATRIX_DEFAULT_ITEMS]
+    base = page[[c for c in MATRIX_BASE_COLUMNS if c in page.columns]].astype(str).reset_index(drop=True)
+    base["제품코드"] = base["제품코드"].str.strip()
+    specs = spec.matrix(base["제품코드"], items, prefer="법적" if source == "법적" else "사내")
+    table = base.join(specs, on="제품코드")
+    st.dataframe(table, use_container_width=True, hide_index=True)
+
+    picked = st.multiselect(f"나란히 비교할 제품 (최대 {COMPARE_MAX}개, 이 페이지에서 선택)",
+                            (base["제품코드"] + " | " + base.get("제품명", "")).tolist(),
+                            max_selections=COMPARE_MAX, key="pf_compare")
+    if picked:
+        st.dataframe(spec.compare([p.split("|")[0].strip() for p in picked]), use_container_width=True)
+
+
+# ============================
+# 제품백서: 본문 전문 검색 (BM25 + 하이라이트)
+# ============================
+FULLTEXT_LIMIT = 20
+
+
+def _product_fulltext_view(df: pd.DataFrame):
+    st.markdown("<h4>📝 <b>제품백서 본문 검색</b></h4>", unsafe_allow_html=True)
+    st.caption("검색 대상: " + ", ".join(TEXT_FIELDS))
+    query = st.text_input("🔎 검색어 (예: 빙점 조정, 우크라이나, 제빵)", key="fulltext_query")
+    if not query.strip():
+        st.info("제품특징·제조방법·용도·거래처·원재료·원산지에서 찾을 내용을 입력해주세요.")
+        return
+
+    hits = get_fulltext_index().search(query, limit=FULLTEXT_LIMIT)
+    if not hits:
+        st.warning("🔍 검색 결과가 없습니다.")
+        return
+    st.caption(f"상위 {len(hits)}개 (관련도 순)")
+
+    labels = []
+    for pos, score in hits:
+        row = df.iloc[pos]
+        label = f"{str(row.get('제품코드', '')).strip()} | {row.get('제품명', '-')}"
+        labels.append(label)
+        lines = "".join(f"<div><b>{field}</b>: {snippet}</div>" for field, snippet in snippets(row, query))
+        st.markdown(f"<div style='margin-bottom:0.8rem;'><b>{html.escape(label)}</b> "
+                    f"<span style='opacity:0.6;'>({score:.2f})</span>{lines}</div>",
+                    unsafe_allow_html=True)
+
+    picked = st.multiselect("카드로 볼 제품", labels, key="fulltext_cards")
+    if picked:
+        product_cards(df.iloc[[hits[labels.index(p)][0] for p in picked]])
@@ -0,0 +1,68 @@
+import os
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from upload_store import store_uploads
+from views.common import DATA_DIR, get_product_options
+
+# ============================
+# 페이지: VOC 기록(이상발생해석)
+# ============================
+def _append_voc(rec: dict):
+    path = os.path.join(DATA_DIR, "voc_logs.csv")
+    pd.DataFrame([rec]).to_csv(path, mode="a", index=False, encoding="utf-8-sig",
+                               header=not os.path.exists(path))
+
+
+def page_voc():
+    st.title("📣 VOC 기록 / 이상발생 해석")
+    with st.form("voc_form", clear_on_submit=True):
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            date = st.date_input("발생일")
+        with c2:
+            source = st.selectbox("유형", ["고객 VOC", "내부 이상", "민원", "기타"])
+        with c3:
+            severity = st.select_slider("심각도", ["Low","Medium","High","Critical"], value="Medium")
+
+        # 제품선택 (서류 요청 페이지와 같은 공용 옵션)
+        _opts = get_product_options().labels
+
+        multi_pick_voc = st.toggle("여러 제품 선택", value=False, help="여러 제품에 대한 VOC라면 켜주세요.", key="voc_multi_pick")
+        if multi_pick_voc:
+            _picked_voc = st.multiselect("관련 제품코드/명 (검색 가능)", options=_opts, placeholder="예: GID*** | 포도당...", key="voc_product_multiselect")
+            product = ", ".join(_picked_voc) if _picked_voc else ""
+        else:
+            product = st.selectbox("관련 제품코드/명 (선택)", options=[""] + _opts, index=0,
+                                       placeholder="클릭 후 검색/선택",
+                                       help="클릭하면 검색 드롭다운이 열립니다.", key="voc_product_selectbox")
+
+        desc = st.text_area("내용", height=120)
+        cause = st.text_area("원인(가설)", height=100)
+        action = st.text_area("즉시조치/대책", height=100)
+        uploaded = st.file_uploader("첨부 (사진/문서)", accept_multiple_files=True)
+        submit = st.form_submit_button("기록 저장")
+        if submit:
+            # 같은 사진을 여러 번 올려도 blob은 하나만 저장
+            saved_files = store_uploads(uploaded)
+            rec = {
+                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "date": str(date), "type": source, "severity": severity,
+                "product": product, "desc": desc, "cause": cause, "action": action,
+                "files": saved_files
+            }
+            _append_voc(rec)
+            st.success("VOC가 저장되었습니다.")
+    path = os.path.join(DATA_DIR, "voc_logs.csv")
+    if os.path.exists(path):
+        st.markdown("---")
+        st.subheader("📈 VOC 로그")
+        df = pd.read_csv(path)
+        st.dataframe(df, use_container_width=True)
+        with st.expander("간단 통계", expanded=False):
+            st.write("유형별 건수")
+            st.bar_chart(df["type"].value_counts())
+            st.write("심각도별 건수")
+            st.bar_chart(df["severity"].value_counts())
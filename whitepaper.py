@@ -0,0 +1,371 @@
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from sample_images import display_urls, index_revision, sample_urls
+
+# ============================
+# 제품백서 카드: 필드 가공 + HTML 렌더링 (제품별 LRU 캐시)
+# ============================
+CARD_CACHE_SIZE = 256
+
+
+def clean_int(value):
+    try:
+        cleaned = re.sub(r"[^\d.]", "", str(value))
+        if cleaned == "":
+            return "-"
+        return f"{int(float(cleaned)):,} KG"
+    except (ValueError, TypeError):
+        return "-"
+
+def parse_spec_text(spec_text):
+    if pd.isna(spec_text):
+        return {}
+    lines = str(spec_text).splitlines()
+    spec_dict = {}
+    for line in lines:
+        match = re.match(r"\s*\d+\.\s*(.+?)\s*:\s*(.+)", line)
+        if match:
+            key, value = match.groups()
+            spec_dict[key.strip()] = value.strip()
+    return spec_dict
+
+def format_features(text):
+    if pd.isna(text):
+        return "-"
+
+    # 1) 줄 단위로 먼저 나누기
+    lines = str(text).splitlines()
+
+    items = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        # 2) 맨 앞에 붙은 -, • 같은 불릿 제거
+        #    예: "- 정제포도당(1A) 대비 입자가 큼" → "정제포도당(1A) 대비 입자가 큼"
+        line = re.sub(r"^[-•]\s*", "", line)
+        items.append(line)
+
+    # 3) 각 줄 앞에 •를 붙이고 <br>로 줄바꿈
+    return "<br>".join(f"• {item}" for item in items)
+
+
+class LRUCache:
+    """크기 제한 LRU (Streamlit 세션 스레드가 같이 쓰므로 lock 사용)"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_create(self, key, factory):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                return self._data[key]
+        value = factory()
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+_FIELDS_CACHE = LRUCache(CARD_CACHE_SIZE)
+_HTML_CACHE = LRUCache(CARD_CACHE_SIZE)
+
+
+def select_products(df: pd.DataFrame, level2=None, level3=None, codes=None) -> pd.DataFrame:
+    """계층구조(2/3레벨) 또는 제품코드 목록으로 거르기 — 인자가 비어 있으면 전체"""
+    mask = pd.Series(True, index=df.index)
+    if level2:
+        mask &= df["계층구조_2레벨"].isin(list(level2))
+    if level3:
+        mask &= df["계층구조_3레벨"].isin(list(level3))
+    if codes:
+        wanted = {str(c).strip().upper() for c in codes if str(c).strip()}
+        mask &= df["제품코드"].astype(str).str.strip().str.upper().isin(wanted)
+    return df[mask]
+
+
+def row_cache_key(row):
+    """(제품코드, 행 내용 해시) — 같은 코드라도 CSV 내용이 바뀌면 새 키"""
+    h = hashlib.sha1()
+    for k, v in row.items():
+        h.update(f"{k}\x1f{v}\x1e".encode("utf-8"))
+    return str(row.get("제품코드", "")), h.hexdigest()
+
+
+def _build_card_fields(row):
+    internal_spec = parse_spec_text(row.get("사내규격(COA)", ""))
+    legal_spec = parse_spec_text(row.get("법적규격", ""))
+    all_keys = set(internal_spec.keys()) | set(legal_spec.keys())
+    all_keys.discard("성상")
+    sample_links = sample_urls(row.get("한도견본", ""))
+    return {
+        "prod_2022": clean_int(row.get('생산실적(2022)')),
+        "prod_2023": clean_int(row.get('생산실적(2023)')),
+        "prod_2024": clean_int(row.get('생산실적(2024)')),
+        "internal_spec": internal_spec,
+        "legal_spec": legal_spec,
+        # (항목, 법적규격, 사내규격) — 성상은 표 첫 줄에 따로 표시
+        "spec_items": [
+            (key, legal_spec.get(key, "-"), internal_spec.get(key, "-"))
+            for key in sorted(all_keys)
+        ],
+        "features_html": format_features(row.get('제품특징', '-')),
+        "sample_links": sample_links,
+    }
+
+
+def card_fields(row):
+    """규격 파싱/생산량/특징 등 카드에 들어가는 가공 필드 (제품별 1회 계산)"""
+    return _FIELDS_CACHE.get_or_create(row_cache_key(row), lambda: _build_card_fields(row))
+
+
+# 카드 공용 스타일/스크립트 — 카드가 여러 장이어도 문서에 한 번만 넣는다
+CARD_CSS = """<style>
+    /* 카드 전체를 흰색 배경 + 검정 글씨로 */
+    body {
+        background-color: #ffffff;
+        color: #000000;
+    }
+
+    .wp-print,
+    .wp-sample {
+        background-color: #ffffff;
+        color: #000000;
+        padding: 16px;
+        box-sizing: border-box;
+    }
+
+    h2, h3, p {
+        color: #000000;
+    }
+
+    table {
+        table-layout: fixed;
+        width: 100%;
+        border-collapse: collapse;
+        background-color: #ffffff;
+    }
+    th, td {
+        border: 1px solid gray;
+        padding: 8px;
+        text-align: center;
+        color: #000000;
+    }
+    th {
+        background-color: #f2f2f2;
+    }
+
+    .wp-grid {
+        display: grid;
+        grid-template-columns: repeat(auto-fit, minmax(420px, 1fr));
+        gap: 16px;
+        align-items: start;
+    }
+    .wp-placeholder {
+        min-height: 1600px;
+        padding: 16px;
+        color: #888888;
+    }
+
+    @media print {
+        button { display: none; }
+        body.wp-printing * { visibility: hidden; }
+        body.wp-printing .wp-print-target,
+        body.wp-printing .wp-print-target * { visibility: visible; }
+        body.wp-printing .wp-print-target { position: absolute; left: 0; top: 0; width: 100%; }
+    }
+
+    #modal {
+        display:none;
+        position:fixed;
+        left:0;
+        top:0;
+        width:100vw;
+        height:100vh;
+        background:rgba(0,0,0,0.7);
+        align-items:center;
+        justify-content:center;
+    }
+    </style>
+"""
+
+CARD_SCRIPT = """
+    <div id="modal" onclick="this.style.display='none'">
+      <img id="modal-img"
+           style="max-width:90%; max-height:90%; object-fit:contain;">
+    </div>
+
+    <script>
+    // 지정한 영역만 인쇄 (문서를 갈아끼우지 않으므로 다른 카드/이벤트가 그대로 남음)
+    function printPart(el) {
+        el.classList.add("wp-print-target");
+        document.body.classList.add("wp-printing");
+        window.print();
+        document.body.classList.remove("wp-printing");
+        el.classList.remove("wp-print-target");
+    }
+    function printCard(btn) {
+        printPart(btn.closest(".wp-card"));
+    }
+    function printSample(btn) {
+        printPart(btn.closest(".wp-card").querySelector(".wp-sample"));
+    }
+    function showModal(src) {
+        document.getElementById("modal-img").src = src;
+        document.getElementById("modal").style.display = "flex";
+    }
+
+    // 지연 카드: 화면 근처로 스크롤될 때 <template> 내용을 붙임 (이미지도 그때 요청)
+    function mountCard(card) {
+        const tpl = card.querySelector("template");
+        if (tpl) card.replaceChildren(tpl.content.cloneNode(true));
+    }
+    (function () {
+        const lazy = document.querySelectorAll(".wp-card[data-lazy]");
+        if (!("IntersectionObserver" in window)) {
+            lazy.forEach(mountCard);
+            return;
+        }
+        const io = new IntersectionObserver(function (entries) {
+            entries.forEach(function (e) {
+                if (e.isIntersecting) {
+                    io.unobserve(e.target);
+                    mountCard(e.target);
+                }
+            });
+        }, { rootMargin: "800px 0px" });
+        lazy.forEach(function (card) { io.observe(card); });
+    })();
+    </script>
+"""
+
+
+def _render_card_body(row, fields):
+    """카드 한 장의 본문 HTML (스타일/스크립트 제외)"""
+    성상_row = '<tr><td>성상</td><td colspan="2">{}</td></tr>'.format(row.get("성상", "-"))
+
+    spec_rows = "".join(
+        f"<tr><td>{key}</td><td>{legal}</td><td>{internal}</td></tr>"
+        for key, legal, internal in fields["spec_items"]
+    )
+
+    # 한도견본
+    if not fields["sample_links"]:
+        sample_html = "해당사항 없음"
+    else:
+        # 캐시된 이미지는 로컬 썸네일, 원본은 모달을 열 때만 요청 (sample_images)
+        imgs = "".join(
+            f'<img src="{img.thumb}" data-full="{img.full}" width="500" loading="lazy" '
+            f'onclick="showModal(this.dataset.full)" style="cursor:pointer; margin:10px;">'
+            for img in map(display_urls, fields["sample_links"])
+        )
+        sample_html = f"""
+        <div style="text-align:left;">
+            {imgs}
+            <div style="margin-top: 10px;">
+                <button onclick="printSample(this)">🖨️ 한도견본만 PDF로 저장</button>
+            </div>
+        </div>
+        """
+
+    return f"""
+    <div class='wp-print'>
+      <h2>{row.get('제품명', '-')}</h2>
+      <p><b>용도:</b> {row.get('용도', '-')}</p>
+
+      <h3>1. 제품 정보</h3>
+      <table>
+        <tr>
+          <th>식품유형</th><th>제품구분</th><th>제품코드</th><th>소비기한</th>
+        </tr>
+        <tr>
+          <td>{row.get('식품유형', '-')}</td>
+          <td>{row.get('구분', '-')}</td>
+          <td>{row.get('제품코드', '-')}</td>
+          <td>{row.get('소비기한', '-')}</td>
+        </tr>
+      </table>
+
+      <h3>📊 생산량 (3개년)</h3>
+      <table>
+        <tr><th>2022</th><th>2023</th><th>2024</th></tr>
+        <tr><td>{fields['prod_2022']}</td><td>{fields['prod_2023']}</td><td>{fields['prod_2024']}</td></tr>
+      </table>
+
+      <h3>2. 주요거래처</h3>
+      <p>{row.get('주요거래처', '-')}</p>
+
+      <h3>3. 제조방법</h3>
+      <p>{row.get('제조방법', '-')}</p>
+
+      <h3>4. 원재료명 및 함량 / 원산지</h3>
+      <p>{row.get('원재료명 및 함량', '-')} / {row.get('원산지', '-')}</p>
+
+      <h3>5. 제품 특징</h3>
+      <p>{fields['features_html']}</p>
+
+      <h3>6. 제품 규격</h3>
+      <table>
+        <tr><th>항목</th><th>법적규격</th><th>사내규격</th></tr>
+        {성상_row}{spec_rows}
+      </table>
+
+      <h3>7. 기타사항</h3>
+      <p>{row.get('기타사항', '-')}</p>
+    </div>
+
+    <div class='wp-sample'>
+      <h3>8. 한도견본</h3>
+      {sample_html}
+    </div>
+
+    <br>
+    <button onclick="printCard(this)">🖨️ 이 제품백서 프린트하기</button>
+    """
+
+
+def card_body_html(row):
+    """카드 본문 HTML — (제품코드, 내용 해시, 한도견본 캐시 색인 버전) 기준 LRU 캐시"""
+    key = (row_cache_key(row), index_revision())
+    return _HTML_CACHE.get_or_create(key, lambda: _render_card_body(row, card_fields(row)))
+
+
+def render_card_html(row):
+    """제품백서 카드 한 장짜리 문서 (공용 스타일 + 본문 + 스크립트)"""
+    return f"{CARD_CSS}<div class='wp-card'>{card_body_html(row)}</div>{CARD_SCRIPT}"
+
+
+def render_cards_html(rows, eager: int = 2):
+    """
+    여러 카드를 한 문서(= iframe 하나)로. 스타일/스크립트는 한 번만 넣고,
+    앞의 eager장만 바로 그리고 나머지는 <template>에 담아 스크롤로 가까워질 때 붙인다.
+    """
+    cards = []
+    for i, row in enumerate(rows):
+        body = card_body_html(row)
+        if i < eager:
+            cards.append(f"<section class='wp-card'>{body}</section>")
+        else:
+            cards.append(
+                f"<section class='wp-card' data-lazy='1'>"
+                f"<div class='wp-placeholder'>📘 {row.get('제품명', '-')} 불러오는 중…</div>"
+                f"<template>{body}</template></section>"
+            )
+    return f"{CARD_CSS}<div class='wp-grid'>{''.join(cards)}</div>{CARD_SCRIPT}"
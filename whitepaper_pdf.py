@@ -0,0 +1,213 @@
+"""
+제품백서 일괄 PDF 내보내기 (fpdf2 + ProcessPoolExecutor)
+
+    python whitepaper_pdf.py --out 제품백서_전체.pdf
+    python whitepaper_pdf.py --out 물엿.zip --zip --level2 "FG0002 : 물엿"
+    python whitepaper_pdf.py --out 선택.pdf --codes GIS7030,GID1110G --workers 2
+
+작업자 프로세스마다 연속된 제품 묶음(chunk)을 한 문서에 그리므로 한글 폰트는
+작업자당 한 번만 읽는다. 병합 PDF는 묶음 PDF를 순서대로 이어붙이고, ZIP은
+묶음 PDF를 제품별 페이지 범위로 잘라 담는다.
+"""
+import argparse
+import io
+import multiprocessing
+import os
+import re
+import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+from fpdf import FPDF
+from fpdf.fonts import FontFace
+from pypdf import PdfReader, PdfWriter
+
+from whitepaper import card_fields, select_products
+
+FONT_PATH = os.environ.get(
+    "INCHON1_PDF_FONT",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "NanumGothic.ttf"),
+)
+FONT_FAMILY = "NanumGothic"
+# 카드 HTML의 th 배경(#f2f2f2)과 맞춤 — 굵은 글꼴은 등록하지 않으므로 강조 없음
+_TABLE_HEADING = FontFace(emphasis=None, fill_color=(242, 242, 242))
+
+# 작업자 프로세스 전역 (initializer에서 설정)
+_WORKER_FONT_PATH = None
+
+
+def _text(value) -> str:
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return "-"
+    text = str(value).strip()
+    return text if text and text.lower() != "nan" else "-"
+
+
+def _safe_filename(text: str) -> str:
+    return re.sub(r'[\\/:*?"<>|\s]+', "_", text).strip("_") or "product"
+
+
+class _WhitepaperPDF(FPDF):
+    def __init__(self, font_path: str):
+        super().__init__(format="A4")
+        self.set_auto_page_break(auto=True, margin=15)
+        self.add_font(FONT_FAMILY, "", font_path)
+        self.set_font(FONT_FAMILY, size=10)
+
+    def heading(self, text, size=12):
+        self.ln(3)
+        self.set_font(FONT_FAMILY, size=size)
+        self.multi_cell(0, 7, text, new_x="LMARGIN", new_y="NEXT")
+        self.set_font(FONT_FAMILY, size=10)
+
+    def paragraph(self, text):
+        self.multi_cell(0, 5.5, text, new_x="LMARGIN", new_y="NEXT")
+
+    def grid(self, header, rows, col_widths=None):
+        with self.table(col_widths=col_widths, text_align="CENTER", line_height=6,
+                        headings_style=_TABLE_HEADING) as table:
+            for values in [header] + rows:
+                r = table.row()
+                for v in values:
+                    # (값, colspan) 튜플이면 여러 칸 병합 — 규격표의 성상 줄
+                    text, span = v if isinstance(v, tuple) else (v, 1)
+                    r.cell(_text(text), colspan=span)
+
+
+def _render_product(pdf: _WhitepaperPDF, row: dict):
+    """product_card와 같은 순서/항목으로 한 제품을 새 페이지에 그림"""
+    fields = card_fields(row)
+    pdf.add_page()
+    pdf.heading(_text(row.get("제품명")), size=16)
+    pdf.paragraph(f"용도: {_text(row.get('용도'))}")
+
+    pdf.heading("1. 제품 정보")
+    pdf.grid(
+        ["식품유형", "제품구분", "제품코드", "소비기한"],
+        [[row.get("식품유형"), row.get("구분"), row.get("제품코드"), row.get("소비기한")]],
+    )
+    pdf.heading("생산량 (3개년)")
+    pdf.grid(["2022", "2023", "2024"], [[fields["prod_2022"], fields["prod_2023"], fields["prod_2024"]]])
+
+    pdf.heading("2. 주요거래처")
+    pdf.paragraph(_text(row.get("주요거래처")))
+    pdf.heading("3. 제조방법")
+    pdf.paragraph(_text(row.get("제조방법")))
+    pdf.heading("4. 원재료명 및 함량 / 원산지")
+    pdf.paragraph(f"{_text(row.get('원재료명 및 함량'))} / {_text(row.get('원산지'))}")
+    pdf.heading("5. 제품 특징")
+    pdf.paragraph(fields["features_html"].replace("<br>", "\n"))
+
+    pdf.heading("6. 제품 규격")
+    spec_rows = [["성상", (row.get("성상"), 2)]] + [list(item) for item in fields["spec_items"]]
+    pdf.grid(["항목", "법적규격", "사내규격"], spec_rows, col_widths=(30, 35, 35))
+
+    pdf.heading("7. 기타사항")
+    pdf.paragraph(_text(row.get("기타사항")))
+
+
+def _init_worker(font_path: str):
+    global _WORKER_FONT_PATH
+    _WORKER_FONT_PATH = font_path
+
+
+def _render_chunk(records, font_path=None):
+    """
+    제품 묶음을 문서 하나로 렌더링 → (PDF bytes, [(제품코드, 제품명, 페이지 수), ...])
+    폰트는 문서당(= 작업자당) 한 번만 add_font
+    """
+    pdf = _WhitepaperPDF(font_path or _WORKER_FONT_PATH)
+    pages = []
+    for row in records:
+        before = pdf.page_no()
+        _render_product(pdf, row)
+        pages.append((_text(row.get("제품코드")), _text(row.get("제품명")), pdf.page_no() - before))
+    return bytes(pdf.output()), pages
+
+
+def _chunks(items, n):
+    size = -(-len(items) // n)
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def render_chunks(df: pd.DataFrame, workers=None, font_path: str = FONT_PATH):
+    """제품 행들을 작업자 수만큼 연속 묶음으로 나눠 병렬 렌더링 (순서 유지)"""
+    if not os.path.exists(font_path):
+        raise FileNotFoundError(
+            f"한글 폰트 파일을 찾을 수 없습니다: {font_path} "
+            f"(NanumGothic.ttf를 앱과 같은 경로에 두거나 INCHON1_PDF_FONT로 지정)"
+        )
+    records = df.to_dict("records")
+    if not records:
+        return []
+    workers = max(1, min(workers or os.cpu_count() or 1, len(records)))
+    chunks = _chunks(records, workers)
+    if len(chunks) == 1:
+        return [_render_chunk(chunks[0], font_path)]
+    # Streamlit 서버 스레드에서 fork하지 않도록 spawn 사용 (작업자는 이 모듈만 import)
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(chunks), mp_context=ctx,
+                             initializer=_init_worker, initargs=(font_path,)) as pool:
+        return list(pool.map(_render_chunk, chunks))
+
+
+def export_whitepapers(df: pd.DataFrame, fmt: str = "pdf", workers=None, font_path: str = FONT_PATH) -> bytes:
+    """fmt='pdf' → 병합 PDF 하나, fmt='zip' → 제품별 PDF를 담은 ZIP"""
+    rendered = render_chunks(df, workers=workers, font_path=font_path)
+    out = io.BytesIO()
+    if fmt == "zip":
+        used = set()
+        with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf:
+            for data, pages in rendered:
+                reader = PdfReader(io.BytesIO(data))
+                start = 0
+                for code, name, n_pages in pages:
+                    writer = PdfWriter()
+                    for p in range(start, start + n_pages):
+                        writer.add_page(reader.pages[p])
+                    start += n_pages
+                    fname = _safe_filename(f"{code}_{name}")
+                    while fname in used:
+                        fname += "_"
+                    used.add(fname)
+                    buf = io.BytesIO()
+                    writer.write(buf)
+                    zf.writestr(f"{fname}.pdf", buf.getvalue())
+    else:
+        writer = PdfWriter()
+        for data, _ in rendered:
+            writer.append(PdfReader(io.BytesIO(data)))
+        writer.write(out)
+    return out.getvalue()
+
+
+def main(argv=None):
+    from product_cache import read_product_frame
+
+    ap = argparse.ArgumentParser(description="제품백서 일괄 PDF 내보내기")
+    ap.add_argument("--out", required=True, help="출력 파일 (.pdf 또는 --zip 시 .zip)")
+    ap.add_argument("--zip", action="store_true", help="제품별 PDF를 ZIP으로 묶기 (기본: 병합 PDF)")
+    ap.add_argument("--level2", action="append", help="계층구조 2레벨 (여러 번 지정 가능)")
+    ap.add_argument("--level3", action="append", help="계층구조 3레벨 (여러 번 지정 가능)")
+    ap.add_argument("--codes", help="쉼표로 구분한 제품코드 목록")
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--font", default=FONT_PATH)
+    args = ap.parse_args(argv)
+
+    df = select_products(
+        read_product_frame(), level2=args.level2, level3=args.level3,
+        codes=args.codes.split(",") if args.codes else None,
+    )
+    if df.empty:
+        print("선택된 제품이 없습니다.", file=sys.stderr)
+        return 1
+    data = export_whitepapers(df, fmt="zip" if args.zip else "pdf", workers=args.workers, font_path=args.font)
+    with open(args.out, "wb") as f:
+        f.write(data)
+    print(f"{len(df)}개 제품 → {args.out} ({len(data) / 1024:.0f} KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())